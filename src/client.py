@@ -1,13 +1,27 @@
 """OpenProject API client."""
 
+import asyncio
 import base64
 import json
-from typing import Any, Dict, Optional, List
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Dict, Optional, List, Tuple
 import httpx
 
 from .models import Priority, Project, Status, Type, User, WorkPackage
 
 
+@lru_cache(maxsize=256)
+def _basic_auth(api_key: str) -> str:
+    """Build the Basic auth header value for an API key."""
+    return "Basic " + base64.b64encode(f"apikey:{api_key}".encode()).decode()
+
+
+def _page_params(page: int, page_size: int) -> Dict[str, Any]:
+    """Build the pagination query parameters for a 1-based page number."""
+    # OpenProject's offset is the 1-based page number, not an item index
+    return {"offset": page, "pageSize": page_size}
+
+
 class AuthenticationError(Exception):
     """Raised when authentication fails."""
 
@@ -19,13 +33,33 @@ class APIError(Exception):
 class OpenProjectClient:
     """Client for interacting with the OpenProject API."""
 
-    def __init__(self, api_url: str, api_key: str, timeout: int = 30):
+    # Maximum number of page requests in flight at once
+    MAX_CONCURRENT_PAGES = 8
+
+    # Retries and base delay in seconds for rate-limited (HTTP 429) GETs
+    MAX_RETRIES = 3
+    RETRY_BACKOFF = 0.5
+
+    # Upper bound in seconds on any single retry delay, including Retry-After
+    MAX_RETRY_DELAY = 10.0
+
+    def __init__(
+        self,
+        api_url: str,
+        api_key: str,
+        timeout: int = 30,
+        client_factory: Optional[Callable[..., httpx.AsyncClient]] = None,
+    ):
         """Initialize the client.
 
         Args:
             api_url: Base URL for the OpenProject API
             api_key: API key for authentication
             timeout: Request timeout in seconds
+            client_factory: Optional callable returning a shared HTTP client;
+                it receives the client settings as keyword arguments and
+                the returned client is left open by close(). Auth headers
+                are sent with every request, so it may ignore them
         """
         if not api_key:
             raise ValueError("API key is required")
@@ -34,21 +68,41 @@ class OpenProjectClient:
         self.api_key = api_key
         self.timeout = timeout
 
-        # Create Basic Auth header
-        auth_string = base64.b64encode(f"apikey:{api_key}".encode()).decode()
         self.headers = {
-            "Authorization": f"Basic {auth_string}",
+            "Authorization": _basic_auth(api_key),
             "Content-Type": "application/json",
             "Accept": "application/hal+json",
         }
 
+        # A client from an injected factory is shared, so it is not ours to close
+        self._owns_client = client_factory is None
+
         # Use the API URL as-is since it should already include /api/v3
-        self._client = httpx.AsyncClient(
+        self._client = (client_factory or httpx.AsyncClient)(
             base_url=self.api_url,
             headers=self.headers,
             timeout=self.timeout,
         )
 
+    @classmethod
+    def from_async_client(
+        cls, client: httpx.AsyncClient, api_url: str, api_key: str
+    ) -> "OpenProjectClient":
+        """Create a client that sends its requests through a shared HTTP client.
+
+        Requests still carry this client's auth and content headers, so the
+        shared client only needs the base URL.
+
+        Args:
+            client: Shared HTTP client, already configured with the base URL
+            api_url: Base URL for the OpenProject API
+            api_key: API key for authentication
+
+        Returns:
+            OpenProjectClient that leaves the shared client open on close()
+        """
+        return cls(api_url, api_key, client_factory=lambda **kwargs: client)
+
     async def test_connection(self) -> bool:
         """Test the connection to the API.
 
@@ -60,7 +114,7 @@ class OpenProjectClient:
             APIError: If the API request fails
         """
         try:
-            response = await self._client.get("/")
+            response = await self._client.get("/", headers=self.headers)
             if response.status_code == 401:
                 raise AuthenticationError(
                     "Authentication failed. Please check your API key."
@@ -109,7 +163,16 @@ class OpenProjectClient:
             APIError: If the API request fails
         """
         try:
-            response = await self._client.get(endpoint, params=params)
+            response = await self._client.get(
+                endpoint, params=params, headers=self.headers
+            )
+            for attempt in range(self.MAX_RETRIES):
+                if response.status_code != 429:
+                    break
+                await asyncio.sleep(self._retry_delay(response, attempt))
+                response = await self._client.get(
+                    endpoint, params=params, headers=self.headers
+                )
             if response.status_code == 401:
                 raise AuthenticationError(
                     "Authentication failed. Please check your API key."
@@ -141,6 +204,24 @@ class OpenProjectClient:
         except Exception as e:
             raise APIError(f"Request failed: {e}")
 
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Get the delay before retrying a rate-limited request.
+
+        Args:
+            response: The rate-limited response
+            attempt: Zero-based retry attempt number
+
+        Returns:
+            Delay in seconds, honouring a numeric Retry-After header and
+            capped at MAX_RETRY_DELAY
+        """
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            delay = self.RETRY_BACKOFF * 2**attempt
+        return min(delay, self.MAX_RETRY_DELAY)
+
     async def _post(
         self, endpoint: str, json: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -158,7 +239,9 @@ class OpenProjectClient:
             APIError: If the API request fails
         """
         try:
-            response = await self._client.post(endpoint, json=json)
+            response = await self._client.post(
+                endpoint, json=json, headers=self.headers
+            )
             if response.status_code == 401:
                 raise AuthenticationError(
                     "Authentication failed. Please check your API key."
@@ -207,7 +290,9 @@ class OpenProjectClient:
             APIError: If the API request fails
         """
         try:
-            response = await self._client.patch(endpoint, json=json)
+            response = await self._client.patch(
+                endpoint, json=json, headers=self.headers
+            )
             if response.status_code == 401:
                 raise AuthenticationError(
                     "Authentication failed. Please check your API key."
@@ -240,8 +325,9 @@ class OpenProjectClient:
             raise APIError(f"Request failed: {e}")
 
     async def close(self):
-        """Close the client connection."""
-        await self._client.aclose()
+        """Close the client connection unless it is shared."""
+        if self._owns_client:
+            await self._client.aclose()
 
     async def __aenter__(self):
         """Enter async context manager."""
@@ -264,7 +350,7 @@ class OpenProjectClient:
         Returns:
             List of Project objects
         """
-        params = {"offset": (page - 1) * page_size + 1, "pageSize": page_size}
+        params = _page_params(page, page_size)
 
         # Add filters if specified
         filters = []
@@ -293,10 +379,76 @@ class OpenProjectClient:
         Returns:
             List of WorkPackage objects
         """
-        params = {
-            "offset": (page - 1) * page_size + 1,
-            "pageSize": page_size,
-        }
+        response = await self._get_work_packages_page(project_id, page, page_size)
+        elements = response.get("_embedded", {}).get("elements", [])
+        return [WorkPackage.from_hal_json(elem) for elem in elements]
+
+    async def get_work_packages_stream(
+        self, project_id: Optional[int] = None, page_size: int = 25
+    ) -> AsyncIterator[WorkPackage]:
+        """Fetch all work packages, yielding each one as its page arrives.
+
+        Args:
+            project_id: Filter by project ID
+            page_size: Number of items per page
+
+        Yields:
+            WorkPackage objects in API order, each ID at most once
+        """
+        response = await self._get_work_packages_page(project_id, 1, page_size)
+        elements = response.get("_embedded", {}).get("elements", [])
+        seen_ids = set()
+        for elem in elements:
+            wp = WorkPackage.from_hal_json(elem)
+            seen_ids.add(wp.id)
+            yield wp
+
+        # The first page reveals the total, so fetch the rest concurrently
+        last_page = -(-response.get("total", 0) // page_size)
+        if not elements or last_page <= 1:
+            return
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PAGES)
+
+        async def fetch_page(page: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._get_work_packages_page(project_id, page, page_size)
+
+        tasks = [
+            asyncio.create_task(fetch_page(page)) for page in range(2, last_page + 1)
+        ]
+        try:
+            # Await in page order so work packages are still yielded in API order
+            for task in tasks:
+                response = await task
+                elements = response.get("_embedded", {}).get("elements", [])
+                for elem in elements:
+                    wp = WorkPackage.from_hal_json(elem)
+                    # Items shifting between page requests can repeat across pages
+                    if wp.id in seen_ids:
+                        continue
+                    seen_ids.add(wp.id)
+                    yield wp
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Wait for the cancellations and retrieve any page errors
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _get_work_packages_page(
+        self, project_id: Optional[int], page: int, page_size: int
+    ) -> Dict[str, Any]:
+        """Fetch a single page of work packages as raw HAL+JSON.
+
+        Args:
+            project_id: Filter by project ID
+            page: Page number (1-based)
+            page_size: Number of items per page
+
+        Returns:
+            JSON response data
+        """
+        params = _page_params(page, page_size)
 
         # Use project-specific endpoint if project_id is provided
         if project_id:
@@ -304,9 +456,7 @@ class OpenProjectClient:
         else:
             endpoint = "/work_packages"
 
-        response = await self._get(endpoint, params=params)
-        elements = response.get("_embedded", {}).get("elements", [])
-        return [WorkPackage.from_hal_json(elem) for elem in elements]
+        return await self._get(endpoint, params=params)
 
     async def create_work_package(
         self,
@@ -403,6 +553,30 @@ class OpenProjectClient:
         response = await self._patch(f"/work_packages/{work_package_id}", json=data)
         return WorkPackage.from_hal_json(response)
 
+    @staticmethod
+    def _parse_types(response: Dict[str, Any]) -> List[Type]:
+        """Parse a HAL+JSON collection of work package types."""
+        elements = response.get("_embedded", {}).get("elements", [])
+        return [Type.from_hal_json(elem) for elem in elements]
+
+    @staticmethod
+    def _parse_statuses(response: Dict[str, Any]) -> List[Status]:
+        """Parse a HAL+JSON collection of statuses."""
+        elements = response.get("_embedded", {}).get("elements", [])
+        return [Status.from_hal_json(elem) for elem in elements]
+
+    @staticmethod
+    def _parse_priorities(response: Dict[str, Any]) -> List[Priority]:
+        """Parse a HAL+JSON collection of priorities."""
+        elements = response.get("_embedded", {}).get("elements", [])
+        return [Priority.from_hal_json(elem) for elem in elements]
+
+    @staticmethod
+    def _parse_users(response: Dict[str, Any]) -> List[User]:
+        """Parse a HAL+JSON collection of users."""
+        elements = response.get("_embedded", {}).get("elements", [])
+        return [User.from_hal_json(elem) for elem in elements]
+
     async def get_types(self, project_id: Optional[int] = None) -> List[Type]:
         """Get available work package types.
 
@@ -413,9 +587,7 @@ class OpenProjectClient:
             List of Type objects
         """
         endpoint = f"/projects/{project_id}/types" if project_id else "/types"
-        response = await self._get(endpoint)
-        elements = response.get("_embedded", {}).get("elements", [])
-        return [Type.from_hal_json(elem) for elem in elements]
+        return self._parse_types(await self._get(endpoint))
 
     async def get_statuses(self) -> List[Status]:
         """Get available statuses.
@@ -423,9 +595,7 @@ class OpenProjectClient:
         Returns:
             List of Status objects
         """
-        response = await self._get("/statuses")
-        elements = response.get("_embedded", {}).get("elements", [])
-        return [Status.from_hal_json(elem) for elem in elements]
+        return self._parse_statuses(await self._get("/statuses"))
 
     async def get_priorities(self) -> List[Priority]:
         """Get available priorities.
@@ -433,9 +603,7 @@ class OpenProjectClient:
         Returns:
             List of Priority objects
         """
-        response = await self._get("/priorities")
-        elements = response.get("_embedded", {}).get("elements", [])
-        return [Priority.from_hal_json(elem) for elem in elements]
+        return self._parse_priorities(await self._get("/priorities"))
 
     async def get_project_members(self, project_id: int) -> List[User]:
         """Get members of a specific project.
@@ -447,8 +615,45 @@ class OpenProjectClient:
             List of User objects who are members of the project
         """
         response = await self._get(f"/projects/{project_id}/available_assignees")
-        elements = response.get("_embedded", {}).get("elements", [])
-        return [User.from_hal_json(elem) for elem in elements]
+        return self._parse_users(response)
+
+    async def get_work_package_form_options(
+        self, project_id: int, type_id: Optional[int] = None
+    ) -> Tuple[List[Type], List[Priority], List[User], List[Status]]:
+        """Fetch the options for a work package form concurrently.
+
+        A failed project member lookup yields no members rather than
+        failing the whole form.
+
+        Args:
+            project_id: Project ID
+            type_id: Optional work package type ID to load new-work-package
+                statuses for
+
+        Returns:
+            Types, priorities, project members and statuses; statuses are
+            empty when no type ID is given
+        """
+
+        async def members_or_empty() -> List[User]:
+            try:
+                return await self.get_project_members(project_id)
+            except Exception as e:
+                print(f"Could not load project members: {e}")
+                return []
+
+        async def no_statuses() -> List[Status]:
+            return []
+
+        types, priorities, members, statuses = await asyncio.gather(
+            self.get_types(project_id),
+            self.get_priorities(),
+            members_or_empty(),
+            self.get_available_statuses_for_new(project_id, type_id)
+            if type_id
+            else no_statuses(),
+        )
+        return types, priorities, members, statuses
 
     async def get_work_package_form(
         self,
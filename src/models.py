@@ -1,11 +1,24 @@
 """Data models for OpenProject entities."""
 
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
+# ISO 8601 time-only durations as returned by OpenProject, e.g. PT4H30M15S
+_ISO_DURATION_RE = re.compile(
+    r"^PT(?:(\d+(?:\.\d+)?)H)?(?:(\d+(?:\.\d+)?)M)?(?:(\d+(?:\.\d+)?)S)?$"
+)
 
-@dataclass
+
+@lru_cache(maxsize=4096)
+def _parse_dt(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, caching results for repeated strings."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+@dataclass(slots=True)
 class Status:
     """Work package status."""
 
@@ -23,7 +36,7 @@ class Status:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Type:
     """Work package type."""
 
@@ -41,7 +54,7 @@ class Type:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Priority:
     """Work package priority."""
 
@@ -57,7 +70,7 @@ class Priority:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User model."""
 
@@ -81,7 +94,7 @@ class User:
         return self.name or self.email or f"User {self.id}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """Project model."""
 
@@ -96,32 +109,35 @@ class Project:
 
     @classmethod
     def from_hal_json(cls, data: Dict[str, Any]) -> "Project":
-        """Create Project from HAL+JSON response."""
-        description = ""
-        if desc_data := data.get("description"):
-            description = desc_data.get("raw", "")
-
-        created_at = None
-        if created_str := data.get("createdAt"):
-            created_at = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
-
-        updated_at = None
-        if updated_str := data.get("updatedAt"):
-            updated_at = datetime.fromisoformat(updated_str.replace("Z", "+00:00"))
-
-        return cls(
-            id=data["id"],
-            identifier=data.get("identifier", ""),
-            name=data["name"],
-            active=data.get("active", True),
-            public=data.get("public", False),
-            description=description,
-            created_at=created_at,
-            updated_at=updated_at,
-        )
-
-
-@dataclass
+        """Create Project from HAL+JSON response in a single pass over its keys."""
+        fields: Dict[str, Any] = {"identifier": ""}
+        for key, value in data.items():
+            if name := _PROJECT_FIELDS.get(key):
+                fields[name] = value
+            elif name := _PROJECT_TIMESTAMPS.get(key):
+                if value:
+                    fields[name] = _parse_dt(value)
+            elif key == "description":
+                if value:
+                    fields["description"] = value.get("raw", "")
+
+        return cls(**fields)
+
+
+# HAL keys copied verbatim onto Project fields
+_PROJECT_FIELDS = {
+    "id": "id",
+    "identifier": "identifier",
+    "name": "name",
+    "active": "active",
+    "public": "public",
+}
+
+# HAL timestamp keys and the Project fields they are parsed into
+_PROJECT_TIMESTAMPS = {"createdAt": "created_at", "updatedAt": "updated_at"}
+
+
+@dataclass(slots=True)
 class WorkPackage:
     """Work package model."""
 
@@ -156,23 +172,23 @@ class WorkPackage:
 
         created_at = None
         if created_str := data.get("createdAt"):
-            created_at = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
+            created_at = _parse_dt(created_str)
 
         updated_at = None
         if updated_str := data.get("updatedAt"):
-            updated_at = datetime.fromisoformat(updated_str.replace("Z", "+00:00"))
+            updated_at = _parse_dt(updated_str)
 
         # Parse embedded resources - OpenProject can put these in either _embedded or _links
-        embedded = data.get("_embedded", {})
-        links = data.get("_links", {})
+        emb = (data.get("_embedded") or {}).get
+        link = (data.get("_links") or {}).get
 
         # Parse related resources
-        status = cls._parse_status(embedded.get("status"), links.get("status"))
-        type_obj = cls._parse_type(embedded.get("type"), links.get("type"))
-        priority = cls._parse_priority(embedded.get("priority"), links.get("priority"))
-        project = cls._parse_project(embedded.get("project"), links.get("project"))
-        author = cls._parse_user(embedded.get("author"), links.get("author"))
-        assignee = cls._parse_user(embedded.get("assignee"), links.get("assignee"))
+        status = cls._parse_status(emb("status"), link("status"))
+        type_obj = cls._parse_type(emb("type"), link("type"))
+        priority = cls._parse_priority(emb("priority"), link("priority"))
+        project = cls._parse_project(emb("project"), link("project"))
+        author = cls._parse_user(emb("author"), link("author"))
+        assignee = cls._parse_user(emb("assignee"), link("assignee"))
 
         return cls(
             id=data["id"],
@@ -201,28 +217,18 @@ class WorkPackage:
             PT8H -> 8.0
             PT4H30M -> 4.5
             PT30M -> 0.5
+            PT1H30M36S -> 1.51
         """
-        if not duration or not duration.startswith("PT"):
+        match = _ISO_DURATION_RE.match(duration) if duration else None
+        if not match:
             return 0.0
 
-        # Remove PT prefix
-        duration = duration[2:]
-
-        hours = 0.0
-        minutes = 0.0
-
-        # Parse hours
-        if "H" in duration:
-            hours_part = duration.split("H")[0]
-            hours = float(hours_part)
-            duration = duration.split("H")[1]
-
-        # Parse minutes
-        if "M" in duration:
-            minutes_part = duration.split("M")[0]
-            minutes = float(minutes_part)
-
-        return hours + (minutes / 60.0)
+        hours, minutes, seconds = match.groups()
+        return (
+            float(hours or 0)
+            + float(minutes or 0) / 60.0
+            + float(seconds or 0) / 3600.0
+        )
 
     @staticmethod
     def _extract_id_from_href(href: str) -> Optional[int]:
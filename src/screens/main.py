@@ -59,6 +59,7 @@ class MainScreen(Screen):
         self.projects = []
         self.filtered_projects = []
         self.search_query = ""
+        self._load_worker = None
 
     def compose(self) -> ComposeResult:
         """Compose the main screen layout."""
@@ -84,7 +85,13 @@ class MainScreen(Screen):
         table.add_column("Status", width=10)
         table.add_column("Public", width=8)
 
-        await self.load_projects()
+        self._start_load()
+
+    def _start_load(self) -> None:
+        """Load projects in a worker so the screen stays responsive."""
+        self._load_worker = self.run_worker(
+            self.load_projects(), group="load", exclusive=True
+        )
 
     async def load_projects(self) -> None:
         """Load projects from the API."""
@@ -112,7 +119,7 @@ class MainScreen(Screen):
 
     async def action_refresh(self) -> None:
         """Refresh the projects list."""
-        await self.load_projects()
+        self._start_load()
 
     async def action_select_project(self) -> None:
         """Select the current project and show work packages."""
@@ -157,8 +164,12 @@ class MainScreen(Screen):
     async def on_input_changed(self, event: Input.Changed) -> None:
         """Handle search input changes."""
         if event.input.id == "search_input":
-            self.search_query = event.value.lower()
-            self._update_table()
+            self.search(event.value)
+
+    def search(self, query: str) -> None:
+        """Filter the projects table by a search query."""
+        self.search_query = query.lower()
+        self._update_table()
 
     @on(Input.Submitted)
     async def on_search_submitted(self) -> None:
@@ -1,5 +1,6 @@
 """Work package form screen for creating and editing."""
 
+import asyncio
 from typing import List, Optional
 
 from textual import on
@@ -230,19 +231,14 @@ class WorkPackageFormScreen(ModalScreen[Optional[WorkPackage]]):
 
     async def _load_form_data(self) -> None:
         """Load all form data from API."""
-        # Load types
-        self.types = await self.client.get_types(project_id=self.project.id)
+        # Statuses for new work packages depend on the type, so they are
+        # loaded when a type is selected; edit mode loads transitions alongside
+        (self.types, self.priorities, self.users, _), _ = await asyncio.gather(
+            self.client.get_work_package_form_options(self.project.id),
+            self._load_statuses(),
+        )
         self._ensure_current_type_in_list()
 
-        # Load priorities
-        self.priorities = await self.client.get_priorities()
-
-        # Load users
-        await self._load_users()
-
-        # Load statuses
-        await self._load_statuses()
-
     def _ensure_current_type_in_list(self) -> None:
         """Ensure current work package type is in the types list."""
         if self.is_edit and self.work_package and self.work_package.type:
@@ -250,14 +246,6 @@ class WorkPackageFormScreen(ModalScreen[Optional[WorkPackage]]):
             if not any(t.id == current_type_id for t in self.types):
                 self.types.insert(0, self.work_package.type)
 
-    async def _load_users(self) -> None:
-        """Load project members."""
-        try:
-            self.users = await self.client.get_project_members(self.project.id)
-        except Exception as e:
-            print(f"Warning: Could not load project members: {e}")
-            self.users = []
-
     async def _load_statuses(self) -> None:
         """Load available statuses based on form mode."""
         if self.is_edit and self.work_package:
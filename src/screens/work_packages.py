@@ -1,17 +1,53 @@
 """Work packages screen for OpenProject TUI."""
 
-from typing import Optional
+import asyncio
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Iterable, Optional, Sequence
 
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.screen import Screen
+from textual.timer import Timer
+from textual.widgets.data_table import RowKey
 from textual.widgets import DataTable, Input, Label, LoadingIndicator, Header, Footer
+from textual.worker import Worker, get_current_worker
 
 from ..client import OpenProjectClient
 from ..config import config
 from ..models import Project, WorkPackage
 from ..widgets import WorkPackagePanel
+from .work_package_form import WorkPackageFormScreen
+
+
+def _trigram_bloom(data: bytes) -> int:
+    """Build a 64-bit bloom filter over the trigrams of the given bytes."""
+    bloom = 0
+    for i in range(len(data) - 2):
+        bloom |= 1 << (hash(data[i : i + 3]) & 63)
+    return bloom
+
+
+@dataclass(slots=True)
+class _SearchIndex:
+    """Precomputed search data for the loaded work packages."""
+
+    haystacks: list[bytes] = field(default_factory=list)
+    blooms: list[int] = field(default_factory=list)
+
+
+def _filter_indices(
+    query: bytes, candidates: Iterable[int], index: _SearchIndex
+) -> list[int]:
+    """Return the candidate row indices whose haystack contains the query."""
+    haystacks = index.haystacks
+    blooms = index.blooms
+    if blooms and len(query) >= 3:
+        # Rows missing any query trigram cannot contain the query
+        qb = _trigram_bloom(query)
+        return [i for i in candidates if blooms[i] & qb == qb and query in haystacks[i]]
+    return [i for i in candidates if query in haystacks[i]]
 
 
 class WorkPackagesScreen(Screen):
@@ -77,6 +113,22 @@ class WorkPackagesScreen(Screen):
         ("e", "edit_work_package", "Edit"),
     ]
 
+    # Delay in seconds before a search keystroke triggers a table rebuild
+    SEARCH_DEBOUNCE = 0.12
+
+    # Minimum number of work packages before trigram blooms are built
+    BLOOM_MIN_ITEMS = 256
+
+    # Minimum number of work packages before filtering moves to a thread
+    THREADED_FILTER_MIN_ITEMS = 5000
+
+    # Most rows a narrowing search removes one at a time; each removal
+    # re-indexes every remaining row, so past this a rebuild is cheaper
+    MAX_ROW_REMOVALS = 16
+
+    # Number of rows above and below the cursor to pre-render in the panel
+    PREWARM_DISTANCE = 3
+
     def __init__(self, project: Project):
         """Initialize the work packages screen."""
         super().__init__()
@@ -85,7 +137,14 @@ class WorkPackagesScreen(Screen):
         self.work_packages = []
         self.filtered_work_packages = []
         self.search_query = ""
+        self._search_index = _SearchIndex()
+        self._filtered_indices: list[int] = []
+        self._last_query = ""
+        self._row_keys: dict[int, RowKey] = {}
+        self._streaming = False
         self.selected_work_package: Optional[WorkPackage] = None
+        self._search_timer: Optional[Timer] = None
+        self._load_worker: Optional[Worker] = None
 
         self.sub_title = f"Work Packages - {project.name}"
 
@@ -113,7 +172,16 @@ class WorkPackagesScreen(Screen):
 
     async def on_mount(self) -> None:
         """Load work packages when screen is mounted."""
-        table = self.query_one("#work_packages_table", DataTable)
+        # Cache widget references used by hot handlers to skip DOM queries
+        self._table = self.query_one("#work_packages_table", DataTable)
+        self._loading = self.query_one("#loading", LoadingIndicator)
+        self._error_label = self.query_one("#error", Label)
+        self._empty_label = self.query_one("#empty_message", Label)
+        self._search_input = self.query_one("#search_input", Input)
+        self._panel = self.query_one("#details_panel", WorkPackagePanel)
+        self._main_container = self.query_one("#main_container", Container)
+
+        table = self._table
 
         table.add_column("ID", width=8)
         table.add_column("Subject", width=50)
@@ -122,14 +190,20 @@ class WorkPackagesScreen(Screen):
         table.add_column("Priority", width=10)
         table.add_column("Assignee", width=20)
 
-        await self.load_work_packages()
+        self._start_load()
+
+    def _start_load(self) -> None:
+        """Load work packages in a worker so the screen stays responsive."""
+        self._load_worker = self.run_worker(
+            self.load_work_packages(), group="load", exclusive=True
+        )
 
     async def load_work_packages(self) -> None:
         """Load work packages from the API."""
-        table = self.query_one("#work_packages_table", DataTable)
-        loading = self.query_one("#loading", LoadingIndicator)
-        error_label = self.query_one("#error", Label)
-        empty_label = self.query_one("#empty_message", Label)
+        table = self._table
+        loading = self._loading
+        error_label = self._error_label
+        empty_label = self._empty_label
 
         loading.display = True
         table.display = False
@@ -137,23 +211,46 @@ class WorkPackagesScreen(Screen):
         empty_label.display = False
 
         try:
-            self.work_packages = await self.client.get_work_packages(
+            self.work_packages = []
+            self._search_index = _SearchIndex()
+            # Streamed rows are filtered against the search shown in the table
+            self._last_query = self.search_query
+            self._filtered_indices = []
+            self.filtered_work_packages = [] if self._last_query else self.work_packages
+            # Start from an empty table since row contents may have changed
+            table.clear()
+            self._row_keys = {}
+            self._streaming = True
+            loaded_ids = set()
+
+            async for wp in self.client.get_work_packages_stream(
                 project_id=self.project.id
-            )
-            self.filtered_work_packages = self.work_packages.copy()
-
+            ):
+                # Rows are keyed by ID, so a repeated work package is skipped
+                if wp.id in loaded_ids:
+                    continue
+                loaded_ids.add(wp.id)
+                self._add_work_package(wp)
+                if loading.display:
+                    loading.display = False
+                    table.display = True
+
+            self._streaming = False
             self._update_table()
 
             loading.display = False
 
         except Exception as e:
+            self._streaming = False
             loading.display = False
+            # Hide any rows painted before the failure; the list is incomplete
+            table.display = False
             error_label.display = True
             error_label.update(f"Error loading work packages: {str(e)}")
 
     async def action_refresh(self) -> None:
         """Refresh the work packages list."""
-        await self.load_work_packages()
+        self._start_load()
 
     async def action_quit(self) -> None:
         """Quit the application."""
@@ -161,8 +258,8 @@ class WorkPackagesScreen(Screen):
 
     async def action_escape_action(self) -> None:
         """Handle escape key with priority: search -> panel -> back."""
-        search_input = self.query_one("#search_input", Input)
-        main_container = self.query_one("#main_container")
+        search_input = self._search_input
+        main_container = self._main_container
 
         if not search_input.has_class("hidden"):
             await self.action_toggle_search()
@@ -173,13 +270,13 @@ class WorkPackagesScreen(Screen):
 
     async def action_select_work_package(self) -> None:
         """Toggle work package details panel."""
-        table = self.query_one("#work_packages_table", DataTable)
+        table = self._table
         if table.cursor_row is not None and table.cursor_row < len(
             self.filtered_work_packages
         ):
             selected_wp = self.filtered_work_packages[table.cursor_row]
-            panel = self.query_one("#details_panel", WorkPackagePanel)
-            main_container = self.query_one("#main_container")
+            panel = self._panel
+            main_container = self._main_container
 
             if (
                 main_container.has_class("panel-visible")
@@ -192,6 +289,7 @@ class WorkPackagesScreen(Screen):
                 self.selected_work_package = selected_wp
                 main_container.add_class("panel-visible")
                 panel.work_package = selected_wp
+                self._schedule_prewarm(table.cursor_row)
 
     @on(DataTable.RowSelected)
     async def on_datatable_row_selected(self) -> None:
@@ -207,38 +305,54 @@ class WorkPackagesScreen(Screen):
             row_index = event.cursor_row
             if 0 <= row_index < len(self.filtered_work_packages):
                 work_package = self.filtered_work_packages[row_index]
-                panel = self.query_one("#details_panel", WorkPackagePanel)
-                main_container = self.query_one("#main_container")
+                panel = self._panel
+                main_container = self._main_container
 
                 # Only update if panel is visible
                 if main_container.has_class("panel-visible"):
                     panel.work_package = work_package
                     self.selected_work_package = work_package
+                    self._schedule_prewarm(row_index)
+
+    def _schedule_prewarm(self, row: int) -> None:
+        """Pre-render the panel for rows around the cursor in the background."""
+        self.run_worker(self._prewarm_neighbors(row), group="prewarm", exclusive=True)
+
+    async def _prewarm_neighbors(self, row: int) -> None:
+        """Populate the panel caches for work packages near the given row."""
+        work_packages = self.filtered_work_packages
+        for distance in range(1, self.PREWARM_DISTANCE + 1):
+            for neighbor in (row + distance, row - distance):
+                if 0 <= neighbor < len(work_packages):
+                    self._panel.prerender(work_packages[neighbor])
+            # Yield between rings so keystrokes are not held up
+            await asyncio.sleep(0)
 
     async def on_unmount(self) -> None:
         """Clean up when screen is unmounted."""
+        self._cancel_pending_search()
         await self.client.close()
 
     async def action_new_work_package(self) -> None:
         """Create a new work package."""
-        from .work_package_form import WorkPackageFormScreen
 
         def on_dismiss(result: Optional[WorkPackage]) -> None:
             if result:
-                self.call_after_refresh(self.load_work_packages)
+                self.call_after_refresh(self._start_load)
 
         self.app.push_screen(WorkPackageFormScreen(self.project), on_dismiss)
 
     async def action_toggle_search(self) -> None:
         """Toggle search input visibility."""
-        search_input = self.query_one("#search_input", Input)
+        search_input = self._search_input
 
         if not search_input.has_class("hidden"):
             search_input.add_class("hidden")
             search_input.value = ""
             self.search_query = ""
+            self._cancel_pending_search()
             self._update_table()
-            table = self.query_one("#work_packages_table", DataTable)
+            table = self._table
             table.focus()
         else:
             search_input.remove_class("hidden")
@@ -248,52 +362,189 @@ class WorkPackagesScreen(Screen):
     async def on_input_changed(self, event: Input.Changed) -> None:
         """Handle search input changes."""
         if event.input.id == "search_input":
-            self.search_query = event.value.lower()
+            new_query = event.value.lower()
+            if new_query == self.search_query:
+                return
+            self.search_query = new_query
+            # Coalesce rapid keystrokes into a single table rebuild
+            self._cancel_pending_search()
+            self._search_timer = self.set_timer(
+                self.SEARCH_DEBOUNCE, self._refresh_search
+            )
+
+    def search(self, query: str) -> None:
+        """Filter the work packages by a search query without debouncing."""
+        self._cancel_pending_search()
+        self.search_query = query.lower()
+        self._refresh_search()
+
+    def _cancel_pending_search(self) -> None:
+        """Stop any pending debounced or threaded search update."""
+        if self._search_timer is not None:
+            self._search_timer.stop()
+            self._search_timer = None
+        self.workers.cancel_group(self, "search")
+
+    def _refresh_search(self) -> None:
+        """Apply the current search, filtering in a thread for large lists."""
+        self._search_timer = None
+        if (
+            not self.search_query
+            or len(self.work_packages) < self.THREADED_FILTER_MIN_ITEMS
+        ):
             self._update_table()
+            return
+
+        # Snapshot the candidates, since streamed rows keep extending the index
+        self.run_worker(
+            partial(
+                self._filter_in_thread,
+                self.search_query,
+                self._candidate_indices()[:],
+                self._search_index,
+                len(self._search_index.haystacks),
+            ),
+            group="search",
+            exclusive=True,
+            thread=True,
+        )
+
+    def _filter_in_thread(
+        self, query: str, candidates: Sequence[int], index: _SearchIndex, count: int
+    ) -> None:
+        """Filter work packages off the event loop and post the result back."""
+        indices = _filter_indices(query.encode(), candidates, index)
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(
+                self._apply_thread_filter, query, indices, index, count
+            )
+
+    def _apply_thread_filter(
+        self, query: str, indices: list[int], index: _SearchIndex, count: int
+    ) -> None:
+        """Apply a threaded filter result unless it has gone stale."""
+        if query == self.search_query and index is self._search_index:
+            # Rows that streamed in while the thread ran were not candidates
+            indices += _filter_indices(
+                query.encode(), range(count, len(index.haystacks)), index
+            )
+            self._apply_filter(indices)
 
     @on(Input.Submitted)
     async def on_search_submitted(self) -> None:
         """Handle search submission - focus on table."""
-        table = self.query_one("#work_packages_table", DataTable)
+        table = self._table
         table.focus()
 
+    def _add_work_package(self, wp: WorkPackage) -> None:
+        """Index a streamed work package and paint it if it matches the search."""
+        i = len(self.work_packages)
+        self.work_packages.append(wp)
+        self._index_work_package(wp)
+        if self._last_query:
+            query = self._last_query.encode()
+            if not _filter_indices(query, (i,), self._search_index):
+                return
+            self._filtered_indices.append(i)
+            self.filtered_work_packages.append(wp)
+        self._row_keys[wp.id] = self._table.add_row(
+            *self._row_cells(wp), key=str(wp.id)
+        )
+
+    def _index_work_package(self, wp: WorkPackage) -> None:
+        """Precompute lowercase search text for a loaded work package."""
+        index = self._search_index
+        # Fields are newline-separated so a query never matches across fields.
+        # UTF-8 bytes keep substring semantics and use the faster bytes search.
+        haystack = "\n".join(
+            filter(
+                None,
+                [
+                    wp.subject.lower(),
+                    wp.status.name.lower() if wp.status else "",
+                    wp.assignee.name.lower() if wp.assignee else "",
+                ],
+            )
+        ).encode()
+        index.haystacks.append(haystack)
+        # Blooms only pay off when there are enough rows to reject cheaply
+        if index.blooms:
+            index.blooms.append(_trigram_bloom(haystack))
+        elif len(index.haystacks) == self.BLOOM_MIN_ITEMS:
+            index.blooms = [_trigram_bloom(h) for h in index.haystacks]
+
+    @staticmethod
+    def _row_cells(wp: WorkPackage) -> tuple[str, ...]:
+        """Return the table cells for a work package."""
+        return (
+            str(wp.id),
+            wp.subject,
+            wp.status.name if wp.status else "N/A",
+            wp.type.name if wp.type else "N/A",
+            wp.priority.name if wp.priority else "N/A",
+            wp.assignee.name if wp.assignee else "Unassigned",
+        )
+
+    def _candidate_indices(self) -> Sequence[int]:
+        """Return the rows that can possibly match the current search query."""
+        # A query extending the previous one can only narrow the results
+        if self._last_query and self.search_query.startswith(self._last_query):
+            return self._filtered_indices
+        return range(len(self._search_index.haystacks))
+
     def _update_table(self) -> None:
         """Update table with filtered work packages."""
-        table = self.query_one("#work_packages_table", DataTable)
-        empty_label = self.query_one("#empty_message", Label)
-        search_input = self.query_one("#search_input", Input)
-
+        indices = None
         if self.search_query:
-            self.filtered_work_packages = [
-                wp
-                for wp in self.work_packages
-                if self.search_query in wp.subject.lower()
-                or (wp.status and self.search_query in wp.status.name.lower())
-                or (wp.assignee and self.search_query in wp.assignee.name.lower())
-            ]
+            indices = _filter_indices(
+                self.search_query.encode(),
+                self._candidate_indices(),
+                self._search_index,
+            )
+        self._apply_filter(indices)
+
+    def _apply_filter(self, indices: Optional[list[int]]) -> None:
+        """Show the given work package rows, or all of them if None."""
+        table = self._table
+        empty_label = self._empty_label
+        search_input = self._search_input
+
+        if indices is not None:
+            self._filtered_indices = indices
+            self.filtered_work_packages = [self.work_packages[i] for i in indices]
         else:
-            self.filtered_work_packages = self.work_packages.copy()
+            self.filtered_work_packages = self.work_packages
+        self._last_query = self.search_query
 
-        table.clear()
+        new_ids = {wp.id for wp in self.filtered_work_packages}
+        dropped = self._row_keys.keys() - new_ids
+        with self.app.batch_update():
+            if (
+                len(dropped) <= self.MAX_ROW_REMOVALS
+                and new_ids <= self._row_keys.keys()
+            ):
+                # Narrowing keeps the relative row order, so only drop stale rows
+                for wp_id in dropped:
+                    table.remove_row(self._row_keys.pop(wp_id))
+            else:
+                # DataTable can only append rows, so rebuild to preserve ordering
+                rows = [self._row_cells(wp) for wp in self.filtered_work_packages]
+                table.clear()
+                self._row_keys = {
+                    wp.id: table.add_row(*row, key=row[0])
+                    for wp, row in zip(self.filtered_work_packages, rows)
+                }
 
         if not self.filtered_work_packages:
-            table.display = False
-            empty_label.display = True
+            # Rows still streaming in may match, so keep the table up
+            if not self._streaming:
+                table.display = False
+                empty_label.display = True
             return
 
         empty_label.display = False
         table.display = True
 
-        for wp in self.filtered_work_packages:
-            table.add_row(
-                str(wp.id),
-                wp.subject,
-                wp.status.name if wp.status else "N/A",
-                wp.type.name if wp.type else "N/A",
-                wp.priority.name if wp.priority else "N/A",
-                wp.assignee.name if wp.assignee else "Unassigned",
-            )
-
         # Keep focus on search input during active search
         if not (not search_input.has_class("hidden") and search_input.has_focus):
             if self.filtered_work_packages and table.row_count > 0:
@@ -301,14 +552,14 @@ class WorkPackagesScreen(Screen):
 
     async def action_close_panel(self) -> None:
         """Close the details panel."""
-        panel = self.query_one("#details_panel", WorkPackagePanel)
-        main_container = self.query_one("#main_container")
+        panel = self._panel
+        main_container = self._main_container
 
         main_container.remove_class("panel-visible")
         panel.work_package = None
         self.selected_work_package = None
 
-        table = self.query_one("#work_packages_table", DataTable)
+        table = self._table
         table.focus()
 
     async def action_edit_work_package(self) -> None:
@@ -316,14 +567,12 @@ class WorkPackagesScreen(Screen):
         if not self.selected_work_package:
             return
 
-        from .work_package_form import WorkPackageFormScreen
-
         def on_dismiss(result: Optional[WorkPackage]) -> None:
             if result:
                 self.selected_work_package = result
-                panel = self.query_one("#details_panel", WorkPackagePanel)
+                panel = self._panel
                 panel.work_package = result
-                self.call_after_refresh(self.load_work_packages)
+                self.call_after_refresh(self._start_load)
 
         self.app.push_screen(
             WorkPackageFormScreen(self.project, self.selected_work_package), on_dismiss
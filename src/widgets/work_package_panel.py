@@ -1,6 +1,9 @@
 """Work package details panel widget."""
 
-from typing import Optional
+from collections import OrderedDict
+from datetime import datetime
+from functools import cache
+from typing import Callable, Optional
 
 from rich.text import Text
 
@@ -12,6 +15,91 @@ from textual.reactive import reactive
 from ..models import WorkPackage
 
 
+@cache
+def _status_style(status_name: str) -> str:
+    """Get the style for a status based on its name."""
+    status_lower = status_name.lower()
+    if "new" in status_lower:
+        return "bold on blue"
+    elif "progress" in status_lower:
+        return "bold black on yellow"
+    elif "closed" in status_lower or "done" in status_lower:
+        return "bold on green"
+    else:
+        return "bold on cyan"
+
+
+@cache
+def _priority_style(priority_name: str) -> str:
+    """Get style for priority based on its name."""
+    priority_lower = priority_name.lower()
+    if "high" in priority_lower:
+        return "bold red"
+    elif "low" in priority_lower:
+        return "dim"
+    return ""
+
+
+# Progress style per 10% bucket: 30% and up is yellow, 70% and up is green
+_PROGRESS_STYLES = ("",) * 3 + ("bold yellow",) * 4 + ("bold green",) * 4
+
+
+def _progress_style(percentage: int) -> str:
+    """Get style for progress based on percentage."""
+    return _PROGRESS_STYLES[min(max(percentage, 0) // 10, 10)]
+
+
+def _format_timestamp(value: Optional[datetime]) -> Optional[str]:
+    """Format a timestamp for display, passing None through."""
+    return value.strftime("%Y-%m-%d %H:%M") if value else None
+
+
+def _no_style(work_package: WorkPackage) -> str:
+    """Return the default style for a detail value."""
+    return ""
+
+
+# (label, value getter, style getter) for each detail line; a getter
+# returning None omits the line
+DETAIL_FIELDS: list[
+    tuple[
+        str,
+        Callable[[WorkPackage], Optional[str]],
+        Callable[[WorkPackage], str],
+    ]
+] = [
+    (
+        "Priority: ",
+        lambda wp: wp.priority.name if wp.priority else None,
+        lambda wp: _priority_style(wp.priority.name),
+    ),
+    (
+        "Assignee: ",
+        lambda wp: wp.assignee.name if wp.assignee else "Unassigned",
+        lambda wp: "" if wp.assignee else "dim italic",
+    ),
+    (
+        "Author: ",
+        lambda wp: wp.author.name if wp.author else None,
+        _no_style,
+    ),
+    ("Start Date: ", lambda wp: wp.start_date or None, _no_style),
+    ("Due Date: ", lambda wp: wp.due_date or None, _no_style),
+    (
+        "Estimated: ",
+        lambda wp: f"{wp.estimated_hours} hours" if wp.estimated_hours else None,
+        _no_style,
+    ),
+    (
+        "Progress: ",
+        lambda wp: f"{wp.percentage_done or 0}%",
+        lambda wp: _progress_style(wp.percentage_done or 0),
+    ),
+    ("Created: ", lambda wp: _format_timestamp(wp.created_at), lambda wp: "dim"),
+    ("Updated: ", lambda wp: _format_timestamp(wp.updated_at), lambda wp: "dim"),
+]
+
+
 class WorkPackagePanel(Container):
     """A panel widget to display work package details."""
 
@@ -37,6 +125,22 @@ class WorkPackagePanel(Container):
 
     work_package: reactive[Optional[WorkPackage]] = reactive(None)
 
+    # Maximum number of rendered work packages kept per cache
+    RENDER_CACHE_SIZE = 64
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the panel."""
+        super().__init__(*args, **kwargs)
+        self._header_cache: OrderedDict[tuple[int, Optional[datetime]], Text] = (
+            OrderedDict()
+        )
+        self._details_cache: OrderedDict[tuple[int, Optional[datetime]], Text] = (
+            OrderedDict()
+        )
+        # What is currently displayed, so unchanged sections can be skipped
+        self._last_rendered: Optional[tuple[int, Optional[datetime]]] = None
+        self._last_description_md = ""
+
     def compose(self) -> ComposeResult:
         """Compose the panel layout."""
         with VerticalScroll():
@@ -44,6 +148,12 @@ class WorkPackagePanel(Container):
             yield Static("", id="panel_details")
             yield Markdown("", id="panel_description")
 
+    def on_mount(self) -> None:
+        """Cache references to the panel sections."""
+        self._header = self.query_one("#panel_header", Static)
+        self._details = self.query_one("#panel_details", Static)
+        self._description = self.query_one("#panel_description", Markdown)
+
     def watch_work_package(self, work_package: Optional[WorkPackage]) -> None:
         """Handle work package changes."""
         if work_package is None:
@@ -53,19 +163,66 @@ class WorkPackagePanel(Container):
 
     def hide_details(self) -> None:
         """Hide work package details and show empty state."""
-        header = self.query_one("#panel_header", Static)
-        header.update("Select a work package to view details")
-        self.query_one("#panel_details", Static).update("")
-        self.query_one("#panel_description", Markdown).update("")
+        self._header.update("Select a work package to view details")
+        self._details.update("")
+        self._description.update("")
+        self._last_rendered = None
+        self._last_description_md = ""
 
     def show_details(self, work_package: WorkPackage) -> None:
         """Show work package details."""
-        self._update_header(work_package)
-        self._update_details(work_package)
+        key = (work_package.id, work_package.updated_at)
+        if key != self._last_rendered:
+            self._update_header(work_package)
+            self._update_details(work_package)
+            self._last_rendered = key
         self._update_description(work_package)
 
+    def prerender(self, work_package: WorkPackage) -> None:
+        """Render a work package into the caches without displaying it."""
+        if self._cache_get(self._header_cache, work_package) is None:
+            self._cache_put(
+                self._header_cache, work_package, self._build_header(work_package)
+            )
+        if self._cache_get(self._details_cache, work_package) is None:
+            self._cache_put(
+                self._details_cache, work_package, self._build_details(work_package)
+            )
+
+    def _cache_get(
+        self,
+        cache: OrderedDict[tuple[int, Optional[datetime]], Text],
+        work_package: WorkPackage,
+    ) -> Optional[Text]:
+        """Return a cached render for the work package, if still current."""
+        key = (work_package.id, work_package.updated_at)
+        content = cache.get(key)
+        if content is not None:
+            cache.move_to_end(key)
+        return content
+
+    def _cache_put(
+        self,
+        cache: OrderedDict[tuple[int, Optional[datetime]], Text],
+        work_package: WorkPackage,
+        content: Text,
+    ) -> None:
+        """Store a render for the work package, evicting the oldest entry."""
+        cache[(work_package.id, work_package.updated_at)] = content
+        if len(cache) > self.RENDER_CACHE_SIZE:
+            cache.popitem(last=False)
+
     def _update_header(self, work_package: WorkPackage) -> None:
         """Update the header with work package title."""
+        header_content = self._cache_get(self._header_cache, work_package)
+        if header_content is None:
+            header_content = self._build_header(work_package)
+            self._cache_put(self._header_cache, work_package, header_content)
+
+        self._header.update(header_content)
+
+    def _build_header(self, work_package: WorkPackage) -> Text:
+        """Build the header text for a work package."""
         header_content = Text()
 
         if work_package.type:
@@ -78,128 +235,49 @@ class WorkPackagePanel(Container):
             header_content.append(" - ")
             header_content.append(
                 f" {work_package.status.name} ",
-                style=self._get_status_style(work_package.status.name),
+                style=_status_style(work_package.status.name),
             )
 
         header_content.append(" - ")
         header_content.append(work_package.subject, style="bold")
 
-        self.query_one("#panel_header", Static).update(header_content)
-
-    def _get_status_style(self, status_name: str) -> str:
-        """Get the style for a status based on its name."""
-        status_lower = status_name.lower()
-        if "new" in status_lower:
-            return "bold on blue"
-        elif "progress" in status_lower:
-            return "bold black on yellow"
-        elif "closed" in status_lower or "done" in status_lower:
-            return "bold on green"
-        else:
-            return "bold on cyan"
+        return header_content
 
     def _update_details(self, work_package: WorkPackage) -> None:
         """Update the details section with work package metadata."""
+        details_content = self._cache_get(self._details_cache, work_package)
+        if details_content is None:
+            details_content = self._build_details(work_package)
+            self._cache_put(self._details_cache, work_package, details_content)
+
+        self._details.update(details_content)
+
+    def _build_details(self, work_package: WorkPackage) -> Text:
+        """Build the details text for a work package."""
         details_content = Text()
 
         details_content.append("─" * 40, style="dim")
         details_content.append("\n\n")
 
-        self._add_priority(details_content, work_package)
-        self._add_assignee(details_content, work_package)
-        self._add_author(details_content, work_package)
-        self._add_dates(details_content, work_package)
-        self._add_progress(details_content, work_package)
-        self._add_timestamps(details_content, work_package)
-
-        self.query_one("#panel_details", Static).update(details_content)
-
-    def _add_priority(self, content: Text, work_package: WorkPackage) -> None:
-        """Add priority information to content."""
-        if work_package.priority:
-            content.append("Priority: ", style="bold dim")
-            priority_style = self._get_priority_style(work_package.priority.name)
-            content.append(work_package.priority.name, style=priority_style)
-            content.append("\n")
-
-    def _get_priority_style(self, priority_name: str) -> str:
-        """Get style for priority based on its name."""
-        priority_lower = priority_name.lower()
-        if "high" in priority_lower:
-            return "bold red"
-        elif "low" in priority_lower:
-            return "dim"
-        return ""
-
-    def _add_assignee(self, content: Text, work_package: WorkPackage) -> None:
-        """Add assignee information to content."""
-        content.append("Assignee: ", style="bold dim")
-        if work_package.assignee:
-            content.append(work_package.assignee.name)
-        else:
-            content.append("Unassigned", style="dim italic")
-        content.append("\n")
-
-    def _add_author(self, content: Text, work_package: WorkPackage) -> None:
-        """Add author information to content."""
-        if work_package.author:
-            content.append("Author: ", style="bold dim")
-            content.append(work_package.author.name)
-            content.append("\n")
-
-    def _add_dates(self, content: Text, work_package: WorkPackage) -> None:
-        """Add date information to content."""
-        if work_package.start_date:
-            content.append("Start Date: ", style="bold dim")
-            content.append(work_package.start_date)
-            content.append("\n")
-
-        if work_package.due_date:
-            content.append("Due Date: ", style="bold dim")
-            content.append(work_package.due_date)
-            content.append("\n")
-
-        if work_package.estimated_hours:
-            content.append("Estimated: ", style="bold dim")
-            content.append(f"{work_package.estimated_hours} hours")
-            content.append("\n")
-
-    def _add_progress(self, content: Text, work_package: WorkPackage) -> None:
-        """Add progress information to content."""
-        percentage = work_package.percentage_done or 0
-        content.append("Progress: ", style="bold dim")
-        progress_style = self._get_progress_style(percentage)
-        content.append(f"{percentage}%", style=progress_style)
-        content.append("\n")
-
-    def _get_progress_style(self, percentage: int) -> str:
-        """Get style for progress based on percentage."""
-        if percentage >= 70:
-            return "bold green"
-        elif percentage >= 30:
-            return "bold yellow"
-        return ""
-
-    def _add_timestamps(self, content: Text, work_package: WorkPackage) -> None:
-        """Add timestamp information to content."""
-        if work_package.created_at:
-            content.append("Created: ", style="bold dim")
-            content.append(
-                work_package.created_at.strftime("%Y-%m-%d %H:%M"), style="dim"
-            )
-            content.append("\n")
+        for label, get_value, get_style in DETAIL_FIELDS:
+            value = get_value(work_package)
+            if value is None:
+                continue
+            details_content.append(label, style="bold dim")
+            details_content.append(value, style=get_style(work_package))
+            details_content.append("\n")
 
-        if work_package.updated_at:
-            content.append("Updated: ", style="bold dim")
-            content.append(
-                work_package.updated_at.strftime("%Y-%m-%d %H:%M"), style="dim"
-            )
-            content.append("\n")
+        return details_content
 
     def _update_description(self, work_package: WorkPackage) -> None:
         """Update the description section."""
         if work_package.description and work_package.description.strip():
             desc_md = f"---\n\n### Description\n\n{work_package.description}"
-            self.query_one("#panel_description", Markdown).update(desc_md)
         else:
-            self.query_one("#panel_description", Markdown).update("")
+            desc_md = ""
+
+        # Skip re-parsing the markdown when the description is unchanged
+        if desc_md == self._last_description_md:
+            return
+        self._last_description_md = desc_md
+        self._description.update(desc_md)
@@ -0,0 +1,48 @@
+"""Shared fixtures and helpers for model and API client tests."""
+
+from operator import attrgetter
+from typing import Any, Callable, Dict
+
+import httpx
+import orjson
+import pytest
+
+Route = Callable[[httpx.Request], httpx.Response]
+
+
+def json_route(data: Any, status_code: int = 200) -> Route:
+    """Build a route that answers every request with the given JSON body.
+
+    The body is serialized once, when the route is built.
+    """
+    body = orjson.dumps(data)
+    headers = {"Content-Type": "application/json"}
+    return lambda request: httpx.Response(status_code, content=body, headers=headers)
+
+
+def assert_model(obj: Any, expected: Dict[str, Any]) -> None:
+    """Assert attributes of ``obj`` match ``expected`` in a single comparison.
+
+    Keys may be dotted paths into nested models, e.g. ``"status.name"``.
+    """
+    actual = {path: attrgetter(path)(obj) for path in expected}
+    assert actual == expected
+
+
+@pytest.fixture(scope="module")
+def routes() -> Dict[str, Route]:
+    """Map request paths to response builders for the mock transport."""
+    return {}
+
+
+@pytest.fixture(scope="module")
+def mock_transport(routes):
+    """Serve requests from ``routes`` by path, answering 404 when unrouted."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        route = routes.get(request.url.path)
+        if route is None:
+            return httpx.Response(404)
+        return route(request)
+
+    return httpx.MockTransport(handler)
@@ -1 +1,22 @@
 """Screen tests package."""
+
+from textual.widgets import Static
+
+from src.models import Priority, Status, Type, User
+
+# Shared, never-mutated model instances for screen test fixtures
+STATUS_NEW = Status(id=1, name="New", color="#0066CC")
+STATUS_IN_PROGRESS = Status(id=2, name="In Progress", color="#00CC00")
+TYPE_FEATURE = Type(id=1, name="Feature", color="#0066CC")
+TYPE_BUG = Type(id=2, name="Bug", color="#CC0000")
+PRIORITY_NORMAL = Priority(id=7, name="Normal")
+PRIORITY_HIGH = Priority(id=8, name="High")
+PRIORITY_IMMEDIATE = Priority(id=9, name="Immediate")
+USER_JOHN = User(id=1, name="John Doe", email="john@example.com")
+USER_JANE = User(id=2, name="Jane Smith", email="jane@example.com")
+
+
+def plain_text(widget: Static) -> str:
+    """Return a label's text, skipping Rich rendering for Text content."""
+    content = widget.renderable
+    return content.plain if hasattr(content, "plain") else str(content)
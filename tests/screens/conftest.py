@@ -0,0 +1,72 @@
+"""Shared fixtures for screen tests."""
+
+import pytest
+import pytest_asyncio
+
+from src.app import OpenProjectApp
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def pilot():
+    """Run one app per test module; tests push and pop their own screens."""
+    async with OpenProjectApp().run_test() as pilot:
+        yield pilot
+
+
+@pytest_asyncio.fixture(autouse=True, loop_scope="module")
+async def reset_screen_stack(request):
+    """Pop any screens a test leaves on the shared app's stack."""
+    if "pilot" not in request.fixturenames:
+        yield
+        return
+    app = request.getfixturevalue("pilot").app
+    depth = len(app.screen_stack)
+    yield
+    while len(app.screen_stack) > depth:
+        await app.pop_screen()
+
+
+class FakeClient:
+    """Stand-in for OpenProjectClient serving canned projects and work packages.
+
+    A plain class rather than a Mock, so building and resetting it costs
+    nothing beyond a few attribute assignments.
+    """
+
+    def __init__(self):
+        """Initialize with no data."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear canned data and recorded calls."""
+        self.projects = []
+        self.work_packages = []
+        self.stream_calls = []
+
+    async def get_projects(self, active=True):
+        """Return the canned projects."""
+        return self.projects
+
+    async def get_work_packages_stream(self, **kwargs):
+        """Yield the canned work packages, recording the call."""
+        self.stream_calls.append(kwargs)
+        for wp in self.work_packages:
+            yield wp
+
+    async def close(self):
+        """Close the client (no-op)."""
+
+
+# Built once at import; mock_clients resets it between tests
+_CLIENT = FakeClient()
+
+
+@pytest.fixture(autouse=True)
+def mock_clients(monkeypatch):
+    """Replace the screens' API client with the shared fake client."""
+    _CLIENT.reset()
+    monkeypatch.setattr("src.screens.main.OpenProjectClient", lambda *a, **kw: _CLIENT)
+    monkeypatch.setattr(
+        "src.screens.work_packages.OpenProjectClient", lambda *a, **kw: _CLIENT
+    )
+    return _CLIENT
@@ -0,0 +1,57 @@
+"""Tests for the widgets each screen composes."""
+
+import pytest
+from textual.widgets import Header
+
+from src.models import Project
+from src.screens.main import MainScreen
+from src.screens.work_packages import WorkPackagesScreen
+
+
+# Share the module-scoped app fixture's event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+PROJECT = Project(id=1, identifier="demo-project", name="Demo Project")
+
+
+@pytest.mark.parametrize(
+    "screen_factory, expected_ids, table_id, column_count",
+    [
+        (
+            MainScreen,
+            {"projects_table", "search_input", "loading", "error"},
+            "projects_table",
+            5,  # ID, Identifier, Name, Status, Public
+        ),
+        (
+            lambda: WorkPackagesScreen(PROJECT),
+            {
+                "work_packages_table",
+                "search_input",
+                "loading",
+                "error",
+                "empty_message",
+                "details_panel",
+            },
+            "work_packages_table",
+            6,  # ID, Subject, Status, Type, Priority, Assignee
+        ),
+    ],
+    ids=["main", "work_packages"],
+)
+async def test_screen_components(
+    pilot, screen_factory, expected_ids, table_id, column_count
+):
+    """Test each screen composes its required widgets."""
+    app = pilot.app
+    screen = screen_factory()
+    await app.push_screen(screen)
+    await screen._load_worker.wait()
+
+    assert screen.query_one(Header) is not None
+
+    # Look up every expected widget in a single DOM walk
+    widgets = {w.id: w for w in screen.query(", ".join(f"#{i}" for i in expected_ids))}
+    assert expected_ids <= widgets.keys()
+
+    assert len(widgets[table_id].columns) == column_count
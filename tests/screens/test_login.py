@@ -1,24 +1,23 @@
 """Tests for screens."""
 
-import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.app import OpenProjectApp
 from src.screens.login import LoginScreen
 from src.client import AuthenticationError
 
+from . import plain_text
+
 
 class TestLoginScreen:
     """Test cases for LoginScreen."""
 
-    @pytest.mark.asyncio
     async def test_login_screen_components(self):
         """Test login screen has required components."""
         async with OpenProjectApp().run_test() as pilot:
             app = pilot.app
             login_screen = LoginScreen()
             await app.push_screen(login_screen)
-            await pilot.pause()  # Wait for screen to mount
 
             # Check for required inputs
             api_url_input = login_screen.query_one("#api_url")
@@ -35,14 +34,12 @@ class TestLoginScreen:
             assert login_button is not None
             assert login_button.label == "Login"
 
-    @pytest.mark.asyncio
     async def test_login_success(self):
         """Test successful login."""
         async with OpenProjectApp().run_test() as pilot:
             app = pilot.app
             login_screen = LoginScreen()
             await app.push_screen(login_screen)
-            await pilot.pause()
 
             # Fill in the form
             api_url_input = login_screen.query_one("#api_url")
@@ -62,7 +59,6 @@ class TestLoginScreen:
                 with patch.object(login_screen, "_save_config", AsyncMock()):
                     # Click login button
                     await pilot.click("#login_button")
-                    await pilot.pause()
 
                     # Verify client was created with correct params
                     mock_client_class.assert_called_once_with(
@@ -73,14 +69,12 @@ class TestLoginScreen:
                     # Verify connection was tested
                     mock_client.test_connection.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_login_authentication_failure(self):
         """Test login with authentication failure."""
         async with OpenProjectApp().run_test() as pilot:
             app = pilot.app
             login_screen = LoginScreen()
             await app.push_screen(login_screen)
-            await pilot.pause()
 
             # Fill in the form
             api_url_input = login_screen.query_one("#api_url")
@@ -99,21 +93,18 @@ class TestLoginScreen:
 
                 # Click login button
                 await pilot.click("#login_button")
-                await pilot.pause()
 
                 # Check for error message
                 error_label = login_screen.query_one("#error_message")
                 assert error_label is not None
-                assert "Invalid API key" in str(error_label.renderable)
+                assert "Invalid API key" in plain_text(error_label)
 
-    @pytest.mark.asyncio
     async def test_login_empty_fields_validation(self):
         """Test login with empty fields shows validation error."""
         async with OpenProjectApp().run_test() as pilot:
             app = pilot.app
             login_screen = LoginScreen()
             await app.push_screen(login_screen)
-            await pilot.pause()
 
             # Clear any existing values
             api_url_input = login_screen.query_one("#api_url")
@@ -123,21 +114,18 @@ class TestLoginScreen:
 
             # Try to login without filling fields
             await pilot.click("#login_button")
-            await pilot.pause()
 
             # Check for error message
             error_label = login_screen.query_one("#error_message")
             assert error_label is not None
-            assert "Please fill in all fields" in str(error_label.renderable)
+            assert "Please fill in all fields" in plain_text(error_label)
 
-    @pytest.mark.asyncio
     async def test_login_saves_config(self):
         """Test successful login saves configuration."""
         async with OpenProjectApp().run_test() as pilot:
             app = pilot.app
             login_screen = LoginScreen()
             await app.push_screen(login_screen)
-            await pilot.pause()
 
             # Fill in the form
             api_url_input = login_screen.query_one("#api_url")
@@ -159,7 +147,6 @@ class TestLoginScreen:
                     ) as mock_save:
                         # Click login button
                         await pilot.click("#login_button")
-                        await pilot.pause()
 
                         # Verify save_config was called
                         mock_save.assert_called_once_with(
@@ -1,17 +1,26 @@
 """Tests for main screen."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.app import OpenProjectApp
 from src.screens.main import MainScreen
+from src.screens.work_packages import WorkPackagesScreen
 from src.models import Project
 
+from . import plain_text
+
+
+# Share the module-scoped app fixture's event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+async def _fail(*args, **kwargs):
+    raise RuntimeError("Connection failed")
+
 
 class TestMainScreen:
     """Test cases for MainScreen."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_projects(self):
         """Create mock projects."""
         return [
@@ -37,101 +46,52 @@ class TestMainScreen:
             ),
         ]
 
-    @pytest.mark.asyncio
-    async def test_main_screen_components(self):
-        """Test main screen has required components."""
-        async with OpenProjectApp().run_test() as pilot:
-            app = pilot.app
-
-            with patch("src.screens.main.OpenProjectClient") as mock_client_class:
-                mock_client = MagicMock()
-                mock_client.get_projects = AsyncMock(return_value=[])
-                mock_client.close = AsyncMock()
-                mock_client_class.return_value = mock_client
-
-                screen = MainScreen()
-                await app.push_screen(screen)
-                await pilot.pause()
-
-                # Check for Header widget
-                from textual.widgets import Header
-
-                assert screen.query_one(Header) is not None
-
-                # Check for projects table
-                table = screen.query_one("#projects_table")
-                assert table is not None
-
-                # Check table has correct columns
-                assert len(table.columns) == 5  # ID, Identifier, Name, Status, Public
-
-    @pytest.mark.asyncio
-    async def test_main_screen_loads_projects(self, mock_projects):
+    async def test_main_screen_loads_projects(self, pilot, mock_projects, mock_clients):
         """Test main screen loads projects on mount."""
-        async with OpenProjectApp().run_test() as pilot:
-            app = pilot.app
+        app = pilot.app
 
-            with patch("src.screens.main.OpenProjectClient") as mock_client_class:
-                mock_client = MagicMock()
-                mock_client.get_projects = AsyncMock(return_value=mock_projects)
-                mock_client.close = AsyncMock()
-                mock_client_class.return_value = mock_client
+        mock_clients.projects = mock_projects
 
-                screen = MainScreen()
-                await app.push_screen(screen)
-                await pilot.pause()
+        screen = MainScreen()
+        await app.push_screen(screen)
+        await screen._load_worker.wait()
 
-                # Verify projects were loaded
-                table = screen.query_one("#projects_table")
-                assert table.row_count == len(mock_projects)
+        # Verify projects were loaded
+        table = screen.query_one("#projects_table")
+        assert table.row_count == len(mock_projects)
 
-    @pytest.mark.asyncio
-    async def test_main_screen_project_selection(self, mock_projects):
+    async def test_main_screen_project_selection(
+        self, pilot, mock_projects, mock_clients
+    ):
         """Test selecting a project navigates to work packages."""
-        async with OpenProjectApp().run_test() as pilot:
-            app = pilot.app
+        app = pilot.app
 
-            with patch("src.screens.main.OpenProjectClient") as mock_client_class:
-                mock_client = MagicMock()
-                mock_client.get_projects = AsyncMock(return_value=mock_projects)
-                mock_client.close = AsyncMock()
-                mock_client_class.return_value = mock_client
+        mock_clients.projects = mock_projects
 
-                screen = MainScreen()
-                await app.push_screen(screen)
-                await pilot.pause()
+        screen = MainScreen()
+        await app.push_screen(screen)
+        await screen._load_worker.wait()
 
-                # Select first project (Enter key)
-                table = screen.query_one("#projects_table")
-                table.focus()
+        # Select first project (Enter key)
+        table = screen.query_one("#projects_table")
+        table.focus()
 
-                # Mock the work packages screen push
-                with patch.object(app, "push_screen"):
-                    await pilot.press("enter")
-                    await pilot.pause()
+        await pilot.press("enter")
 
-                    # Note: The actual navigation will be implemented
-                    # when we create the work packages screen
+        assert isinstance(app.screen, WorkPackagesScreen)
+        assert app.screen.project is mock_projects[0]
 
-    @pytest.mark.asyncio
-    async def test_main_screen_error_handling(self):
+    async def test_main_screen_error_handling(self, pilot, mock_clients, monkeypatch):
         """Test error handling when loading projects fails."""
-        async with OpenProjectApp().run_test() as pilot:
-            app = pilot.app
-
-            with patch("src.screens.main.OpenProjectClient") as mock_client_class:
-                mock_client = MagicMock()
-                mock_client.get_projects = AsyncMock(
-                    side_effect=Exception("Connection failed")
-                )
-                mock_client.close = AsyncMock()
-                mock_client_class.return_value = mock_client
-
-                screen = MainScreen()
-                await app.push_screen(screen)
-                await pilot.pause()
-
-                # Check for error message
-                error_label = screen.query_one("#error")
-                assert error_label is not None
-                assert "Error loading projects" in str(error_label.renderable)
+        app = pilot.app
+
+        monkeypatch.setattr(mock_clients, "get_projects", _fail)
+
+        screen = MainScreen()
+        await app.push_screen(screen)
+        await screen._load_worker.wait()
+
+        # Check for error message
+        error_label = screen.query_one("#error")
+        assert error_label is not None
+        assert "Error loading projects" in plain_text(error_label)
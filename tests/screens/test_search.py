@@ -1,19 +1,39 @@
 """Tests for search functionality."""
 
+import asyncio
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
 from textual.widgets import Input
 
-from src.app import OpenProjectApp
 from src.screens.main import MainScreen
 from src.screens.work_packages import WorkPackagesScreen
-from src.models import Project, WorkPackage, Status, Type, Priority, User
+from src.models import Project, WorkPackage
+
+from . import (
+    PRIORITY_HIGH,
+    PRIORITY_IMMEDIATE,
+    PRIORITY_NORMAL,
+    STATUS_IN_PROGRESS,
+    STATUS_NEW,
+    TYPE_BUG,
+    TYPE_FEATURE,
+    USER_JANE,
+    USER_JOHN,
+)
+
+
+# Share the module-scoped app fixture's event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+TEST_PROJECT = Project(
+    id=1, identifier="test-project", name="Test Project", active=True, public=False
+)
 
 
 class TestSearchFunctionality:
     """Test cases for search functionality in screens."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_projects(self):
         """Create mock projects."""
         return [
@@ -49,100 +69,41 @@ class TestSearchFunctionality:
             ),
         ]
 
-    @pytest.mark.asyncio
-    async def test_main_screen_search_toggle(self, mock_projects):
-        """Test pressing / shows search input on main screen."""
-        async with OpenProjectApp().run_test() as pilot:
-            app = pilot.app
-
-            with patch("src.screens.main.OpenProjectClient") as mock_client_class:
-                mock_client = MagicMock()
-                mock_client.get_projects = AsyncMock(return_value=mock_projects)
-                mock_client.close = AsyncMock()
-                mock_client_class.return_value = mock_client
-
-                screen = MainScreen()
-                await app.push_screen(screen)
-                await pilot.pause()
-
-                # Initially, search input should be hidden
-                search_input = screen.query_one("#search_input", Input)
-                assert search_input.has_class("hidden")
-
-                # Press / to show search
-                await pilot.press("/")
-                await pilot.pause()
-
-                # Search should now be visible and focused
-                assert not search_input.has_class("hidden")
-                assert search_input.has_focus
-
-    @pytest.mark.asyncio
-    async def test_main_screen_search_filter(self, mock_projects):
-        """Test search filters projects by name."""
-        async with OpenProjectApp().run_test() as pilot:
-            app = pilot.app
-
-            with patch("src.screens.main.OpenProjectClient") as mock_client_class:
-                mock_client = MagicMock()
-                mock_client.get_projects = AsyncMock(return_value=mock_projects)
-                mock_client.close = AsyncMock()
-                mock_client_class.return_value = mock_client
-
-                screen = MainScreen()
-                await app.push_screen(screen)
-                await pilot.pause()
-
-                # Show search
-                await pilot.press("/")
-                await pilot.pause()
-
-                # Type search term
-                search_input = screen.query_one("#search_input", Input)
-                search_input.value = "demo"
-                await pilot.pause()
-
-                # Check that table is filtered
-                table = screen.query_one("#projects_table")
-                # Should show only projects with "demo" in the name
-                assert table.row_count == 2  # "Demo Project" and "Another Demo"
-
-    @pytest.mark.asyncio
-    async def test_main_screen_clear_search(self, mock_projects):
-        """Test clearing search with ESC."""
-        async with OpenProjectApp().run_test() as pilot:
-            app = pilot.app
-
-            with patch("src.screens.main.OpenProjectClient") as mock_client_class:
-                mock_client = MagicMock()
-                mock_client.get_projects = AsyncMock(return_value=mock_projects)
-                mock_client.close = AsyncMock()
-                mock_client_class.return_value = mock_client
-
-                screen = MainScreen()
-                await app.push_screen(screen)
-                await pilot.pause()
-
-                # Show search and type
-                await pilot.press("/")
-                await pilot.pause()
-
-                search_input = screen.query_one("#search_input", Input)
-                search_input.value = "test"
-                await pilot.pause()
-
-                # Press ESC to clear and hide search
-                await pilot.press("escape")
-                await pilot.pause()
-
-                # Search input should be hidden and table should show all projects
-                assert search_input.has_class("hidden")
-                assert search_input.value == ""
-
-                table = screen.query_one("#projects_table")
-                assert table.row_count == 3  # All projects
-
-    @pytest.fixture
+    async def test_main_screen_search(self, pilot, mock_projects, mock_clients):
+        """Test showing, filtering and clearing search on the main screen."""
+        app = pilot.app
+
+        mock_clients.projects = mock_projects
+
+        screen = MainScreen()
+        await app.push_screen(screen)
+        await screen._load_worker.wait()
+
+        # Initially, search input should be hidden
+        search_input = screen.query_one("#search_input", Input)
+        table = screen.query_one("#projects_table")
+        assert search_input.has_class("hidden")
+
+        # Press / to show search
+        await pilot.press("/")
+
+        # Search should now be visible and focused
+        assert not search_input.has_class("hidden")
+        assert search_input.has_focus
+
+        # Should show only projects with "demo" in the name
+        screen.search("demo")
+        assert table.row_count == 2  # "Demo Project" and "Another Demo"
+
+        # Press ESC to clear and hide search
+        await pilot.press("escape")
+
+        # Search input should be hidden and table should show all projects
+        assert search_input.has_class("hidden")
+        assert search_input.value == ""
+        assert table.row_count == 3  # All projects
+
+    @pytest.fixture(scope="module")
     def mock_work_packages(self):
         """Create mock work packages."""
         return [
@@ -150,68 +111,211 @@ class TestSearchFunctionality:
                 id=1,
                 subject="Fix login bug",
                 description="Login fails with special characters",
-                status=Status(id=1, name="New", color="#0066CC"),
-                type=Type(id=2, name="Bug", color="#CC0000"),
-                priority=Priority(id=8, name="High"),
-                assignee=User(id=1, name="John Doe", email="john@example.com"),
+                status=STATUS_NEW,
+                type=TYPE_BUG,
+                priority=PRIORITY_HIGH,
+                assignee=USER_JOHN,
             ),
             WorkPackage(
                 id=2,
                 subject="Add new feature",
                 description="Implement user preferences",
-                status=Status(id=2, name="In Progress", color="#00CC00"),
-                type=Type(id=1, name="Feature", color="#0066CC"),
-                priority=Priority(id=7, name="Normal"),
-                assignee=User(id=2, name="Jane Smith", email="jane@example.com"),
+                status=STATUS_IN_PROGRESS,
+                type=TYPE_FEATURE,
+                priority=PRIORITY_NORMAL,
+                assignee=USER_JANE,
             ),
             WorkPackage(
                 id=3,
                 subject="Fix performance issue",
                 description="App is slow on large datasets",
-                status=Status(id=1, name="New", color="#0066CC"),
-                type=Type(id=2, name="Bug", color="#CC0000"),
-                priority=Priority(id=9, name="Immediate"),
+                status=STATUS_NEW,
+                type=TYPE_BUG,
+                priority=PRIORITY_IMMEDIATE,
                 assignee=None,
             ),
         ]
 
-    @pytest.mark.asyncio
-    async def test_work_packages_screen_search(self, mock_work_packages):
+    async def test_work_packages_screen_search(
+        self, pilot, mock_work_packages, mock_clients
+    ):
         """Test search on work packages screen."""
-        project = Project(
-            id=1,
-            identifier="test-project",
-            name="Test Project",
-            active=True,
-            public=False,
+        app = pilot.app
+
+        mock_clients.work_packages = mock_work_packages
+
+        screen = WorkPackagesScreen(TEST_PROJECT)
+        await app.push_screen(screen)
+        await screen._load_worker.wait()
+
+        # Show search
+        await pilot.press("/")
+
+        # Search for "fix"
+        search_input = screen.query_one("#search_input", Input)
+        search_input.value = "fix"
+        await pilot.pause(WorkPackagesScreen.SEARCH_DEBOUNCE * 2)
+
+        # Should show work packages with "fix" in subject
+        table = screen.query_one("#work_packages_table")
+        assert table.row_count == 2  # Two items with "fix"
+
+    async def test_work_packages_screen_search_narrow_and_widen(
+        self, pilot, mock_work_packages, mock_clients
+    ):
+        """Test extending and then shortening a search query."""
+        app = pilot.app
+
+        mock_clients.work_packages = mock_work_packages
+
+        screen = WorkPackagesScreen(TEST_PROJECT)
+        await app.push_screen(screen)
+        await screen._load_worker.wait()
+
+        table = screen.query_one("#work_packages_table")
+
+        # Each query extends the previous one, narrowing the results
+        for query, expected in [("f", 3), ("fix", 2), ("fix l", 1)]:
+            screen.search(query)
+            assert table.row_count == expected
+            assert [row.key.value for row in table.ordered_rows] == [
+                str(wp.id) for wp in screen.filtered_work_packages
+            ]
+
+        # Shortening the query widens the results again
+        screen.search("fi")
+        assert table.row_count == 2
+
+    async def test_work_packages_screen_search_narrow_large_list(
+        self, pilot, mock_clients, monkeypatch
+    ):
+        """Test narrowing a large list rebuilds the table instead of removing rows."""
+        work_packages = [
+            WorkPackage(
+                id=i,
+                subject=f"Task {i} {'rare' if i % 500 == 0 else 'common'}",
+                status=STATUS_NEW,
+            )
+            for i in range(1, 3001)
+        ]
+        mock_clients.work_packages = work_packages
+
+        screen = WorkPackagesScreen(TEST_PROJECT)
+        await pilot.app.push_screen(screen)
+        await screen._load_worker.wait()
+
+        table = screen.query_one("#work_packages_table")
+        removed = []
+        remove_row = table.remove_row
+        monkeypatch.setattr(
+            table, "remove_row", lambda key: removed.append(key) or remove_row(key)
         )
 
-        async with OpenProjectApp().run_test() as pilot:
-            app = pilot.app
-
-            with patch(
-                "src.screens.work_packages.OpenProjectClient"
-            ) as mock_client_class:
-                mock_client = MagicMock()
-                mock_client.get_work_packages = AsyncMock(
-                    return_value=mock_work_packages
-                )
-                mock_client.close = AsyncMock()
-                mock_client_class.return_value = mock_client
-
-                screen = WorkPackagesScreen(project)
-                await app.push_screen(screen)
-                await pilot.pause()
-
-                # Show search
-                await pilot.press("/")
-                await pilot.pause()
-
-                # Search for "fix"
-                search_input = screen.query_one("#search_input", Input)
-                search_input.value = "fix"
-                await pilot.pause()
-
-                # Should show work packages with "fix" in subject
-                table = screen.query_one("#work_packages_table")
-                assert table.row_count == 2  # Two items with "fix"
+        # Dropping thousands of rows one by one is quadratic in the table size
+        screen.search("rare")
+        assert len(removed) <= WorkPackagesScreen.MAX_ROW_REMOVALS
+        assert [row.key.value for row in table.ordered_rows] == [
+            str(i) for i in range(500, 3001, 500)
+        ]
+
+        # Dropping a handful of rows still removes them in place
+        screen.search("task 299")
+        removed.clear()
+        screen.search("task 2999")
+        assert len(removed) == 10
+        assert [row.key.value for row in table.ordered_rows] == ["2999"]
+
+    async def test_work_packages_screen_search_while_loading(
+        self, pilot, mock_work_packages, mock_clients, monkeypatch
+    ):
+        """Test a search made mid-stream filters loaded and later rows."""
+        pages_sent = [asyncio.Event(), asyncio.Event()]
+        releases = [asyncio.Event(), asyncio.Event()]
+
+        async def slow_stream(**kwargs):
+            for page, sent, release in zip(
+                [mock_work_packages[:2], mock_work_packages[2:]], pages_sent, releases
+            ):
+                for wp in page:
+                    yield wp
+                sent.set()
+                await release.wait()
+
+        monkeypatch.setattr(mock_clients, "get_work_packages_stream", slow_stream)
+
+        screen = WorkPackagesScreen(TEST_PROJECT)
+        await pilot.app.push_screen(screen)
+        await pages_sent[0].wait()
+
+        table = screen.query_one("#work_packages_table")
+        empty_label = screen.query_one("#empty_message")
+
+        # A search with no matches yet must not claim the project is empty
+        screen.search("performance")
+        assert table.row_count == 0
+        assert table.display
+        assert not empty_label.display
+
+        # The rows loaded so far are filtered straight away
+        screen.search("fix")
+        assert [row.key.value for row in table.ordered_rows] == ["1"]
+        assert table.display
+
+        # Rows arriving later are painted if they match, before loading ends
+        releases[0].set()
+        await pages_sent[1].wait()
+        assert screen._load_worker.is_running
+        assert [row.key.value for row in table.ordered_rows] == ["1", "3"]
+
+        releases[1].set()
+        await screen._load_worker.wait()
+
+        assert [wp.id for wp in screen.filtered_work_packages] == [1, 3]
+        assert table.row_count == 2
+        assert not empty_label.display
+
+    async def test_work_packages_screen_search_large_list(self, pilot, mock_clients):
+        """Test search results with trigram blooms enabled for large lists."""
+        work_packages = [
+            WorkPackage(
+                id=i,
+                subject=f"Task {i} {'bugfix' if i % 7 == 0 else 'feature'}",
+                status=STATUS_NEW,
+            )
+            for i in range(1, WorkPackagesScreen.BLOOM_MIN_ITEMS + 50)
+        ]
+
+        app = pilot.app
+
+        mock_clients.work_packages = work_packages
+
+        screen = WorkPackagesScreen(TEST_PROJECT)
+        await app.push_screen(screen)
+        await screen._load_worker.wait()
+
+        assert len(screen._search_index.blooms) == len(work_packages)
+
+        for query in ["bug", "bugfix", "task 14 ", "nomatch"]:
+            screen.search(query)
+            expected = [wp for wp in work_packages if query in wp.subject.lower()]
+            assert screen.filtered_work_packages == expected
+
+    async def test_work_packages_screen_search_in_thread(
+        self, pilot, mock_work_packages, mock_clients
+    ):
+        """Test search filtering in a worker thread."""
+        app = pilot.app
+
+        mock_clients.work_packages = mock_work_packages
+
+        screen = WorkPackagesScreen(TEST_PROJECT)
+        screen.THREADED_FILTER_MIN_ITEMS = 1
+        await app.push_screen(screen)
+        await screen._load_worker.wait()
+
+        screen.search("fix")
+        await screen.workers.wait_for_complete()
+
+        table = screen.query_one("#work_packages_table")
+        assert table.row_count == 2
+        assert [wp.id for wp in screen.filtered_work_packages] == [1, 3]
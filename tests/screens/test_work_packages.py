@@ -1,17 +1,45 @@
 """Tests for work packages screen."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.app import OpenProjectApp
 from src.screens.work_packages import WorkPackagesScreen
-from src.models import Project, WorkPackage, Status, Type, Priority, User
+from src.models import Project, WorkPackage
+
+from . import (
+    PRIORITY_HIGH,
+    PRIORITY_NORMAL,
+    STATUS_IN_PROGRESS,
+    STATUS_NEW,
+    TYPE_BUG,
+    TYPE_FEATURE,
+    USER_JANE,
+    USER_JOHN,
+    plain_text,
+)
+
+
+# Share the module-scoped app fixture's event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+DEMO_PROJECT = Project(
+    id=1, identifier="demo-project", name="Demo Project", active=True, public=False
+)
+
+
+async def _fail_stream(*args, **kwargs):
+    raise RuntimeError("API Error")
+    yield
+
+
+async def _fail_after_first_page(*args, **kwargs):
+    yield WorkPackage(id=1, subject="Fix login bug")
+    raise RuntimeError("API Error")
 
 
 class TestWorkPackagesScreen:
     """Test cases for WorkPackagesScreen."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_project(self):
         """Create a mock project."""
         return Project(
@@ -25,7 +53,7 @@ class TestWorkPackagesScreen:
             updated_at="2024-01-02T00:00:00Z",
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_work_packages(self):
         """Create mock work packages."""
         return [
@@ -39,18 +67,12 @@ class TestWorkPackagesScreen:
                 percentage_done=50,
                 created_at="2024-01-01T00:00:00Z",
                 updated_at="2024-01-02T00:00:00Z",
-                status=Status(id=1, name="New", color="#0066CC"),
-                type=Type(id=2, name="Bug", color="#CC0000"),
-                priority=Priority(id=8, name="High"),
-                project=Project(
-                    id=1,
-                    identifier="demo-project",
-                    name="Demo Project",
-                    active=True,
-                    public=False,
-                ),
-                author=User(id=1, name="John Doe", email="john@example.com"),
-                assignee=User(id=2, name="Jane Smith", email="jane@example.com"),
+                status=STATUS_NEW,
+                type=TYPE_BUG,
+                priority=PRIORITY_HIGH,
+                project=DEMO_PROJECT,
+                author=USER_JOHN,
+                assignee=USER_JANE,
             ),
             WorkPackage(
                 id=2,
@@ -62,175 +84,136 @@ class TestWorkPackagesScreen:
                 percentage_done=0,
                 created_at="2024-01-10T00:00:00Z",
                 updated_at="2024-01-10T00:00:00Z",
-                status=Status(id=2, name="In Progress", color="#00CC00"),
-                type=Type(id=1, name="Feature", color="#0066CC"),
-                priority=Priority(id=7, name="Normal"),
-                project=Project(
-                    id=1,
-                    identifier="demo-project",
-                    name="Demo Project",
-                    active=True,
-                    public=False,
-                ),
-                author=User(id=1, name="John Doe", email="john@example.com"),
+                status=STATUS_IN_PROGRESS,
+                type=TYPE_FEATURE,
+                priority=PRIORITY_NORMAL,
+                project=DEMO_PROJECT,
+                author=USER_JOHN,
                 assignee=None,
             ),
         ]
 
-    @pytest.mark.asyncio
-    async def test_work_packages_screen_components(self, mock_project):
-        """Test work packages screen has required components."""
-        async with OpenProjectApp().run_test() as pilot:
-            app = pilot.app
-            screen = WorkPackagesScreen(mock_project)
-            await app.push_screen(screen)
-            await pilot.pause()
+    async def test_work_packages_screen_loads_data(
+        self,
+        pilot,
+        mock_project,
+        mock_work_packages,
+        mock_clients,
+    ):
+        """Test work packages screen loads data on mount."""
+        app = pilot.app
 
-            # Check for Header widget
-            from textual.widgets import Header
+        mock_clients.work_packages = mock_work_packages
 
-            assert screen.query_one(Header) is not None
-            # Project name is now in sub_title
-            assert mock_project.name in screen.sub_title
+        screen = WorkPackagesScreen(mock_project)
+        await app.push_screen(screen)
+        await screen._load_worker.wait()
 
-            # Check for work packages table
-            table = screen.query_one("#work_packages_table")
-            assert table is not None
+        # Project name is shown in the sub_title
+        assert mock_project.name in screen.sub_title
 
-            # Check for loading indicator
-            loading = screen.query_one("#loading")
-            assert loading is not None
+        # Verify client was called with correct project ID
+        assert mock_clients.stream_calls == [{"project_id": mock_project.id}]
+
+        # Check table has correct columns
+        table = screen.query_one("#work_packages_table")
+        assert len(table.columns) >= 6  # ID, Subject, Status, Type, Priority, Assignee
 
-    @pytest.mark.asyncio
-    async def test_work_packages_screen_loads_data(
-        self, mock_project, mock_work_packages
-    ):
-        """Test work packages screen loads data on mount."""
-        async with OpenProjectApp().run_test() as pilot:
-            app = pilot.app
-
-            with patch(
-                "src.screens.work_packages.OpenProjectClient"
-            ) as mock_client_class:
-                mock_client = MagicMock()
-                mock_client.get_work_packages = AsyncMock(
-                    return_value=mock_work_packages
-                )
-                mock_client.close = AsyncMock()
-                mock_client_class.return_value = mock_client
-
-                screen = WorkPackagesScreen(mock_project)
-                await app.push_screen(screen)
-                await pilot.pause()
-
-                # Verify client was called with correct project ID
-                mock_client.get_work_packages.assert_called_once_with(
-                    project_id=mock_project.id
-                )
-
-                # Check table has correct columns
-                table = screen.query_one("#work_packages_table")
-                assert (
-                    len(table.columns) >= 6
-                )  # ID, Subject, Status, Type, Priority, Assignee
-
-    @pytest.mark.asyncio
     async def test_work_packages_table_displays_data(
-        self, mock_project, mock_work_packages
+        self,
+        pilot,
+        mock_project,
+        mock_work_packages,
+        mock_clients,
     ):
         """Test work packages are displayed in the table."""
-        async with OpenProjectApp().run_test() as pilot:
-            app = pilot.app
-
-            with patch(
-                "src.screens.work_packages.OpenProjectClient"
-            ) as mock_client_class:
-                mock_client = MagicMock()
-                mock_client.get_work_packages = AsyncMock(
-                    return_value=mock_work_packages
-                )
-                mock_client.close = AsyncMock()
-                mock_client_class.return_value = mock_client
-
-                screen = WorkPackagesScreen(mock_project)
-                await app.push_screen(screen)
-                await pilot.pause()
-
-                # Check table has rows
-                table = screen.query_one("#work_packages_table")
-                assert table.row_count == len(mock_work_packages)
-
-    @pytest.mark.asyncio
-    async def test_work_packages_empty_state(self, mock_project):
+        app = pilot.app
+
+        mock_clients.work_packages = mock_work_packages
+
+        screen = WorkPackagesScreen(mock_project)
+        await app.push_screen(screen)
+        await screen._load_worker.wait()
+
+        # Check table has rows
+        table = screen.query_one("#work_packages_table")
+        assert table.row_count == len(mock_work_packages)
+
+    async def test_work_packages_duplicate_ids(
+        self, pilot, mock_project, mock_work_packages, mock_clients
+    ):
+        """Test a work package repeated by the stream is only shown once."""
+        mock_clients.work_packages = [*mock_work_packages, mock_work_packages[1]]
+
+        screen = WorkPackagesScreen(mock_project)
+        await pilot.app.push_screen(screen)
+        await screen._load_worker.wait()
+
+        table = screen.query_one("#work_packages_table")
+        assert not screen.query_one("#error").display
+        assert [row.key.value for row in table.ordered_rows] == [
+            str(wp.id) for wp in mock_work_packages
+        ]
+
+    async def test_work_packages_empty_state(self, pilot, mock_project):
         """Test empty state when no work packages."""
-        async with OpenProjectApp().run_test() as pilot:
-            app = pilot.app
-
-            with patch(
-                "src.screens.work_packages.OpenProjectClient"
-            ) as mock_client_class:
-                mock_client = MagicMock()
-                mock_client.get_work_packages = AsyncMock(return_value=[])
-                mock_client.close = AsyncMock()
-                mock_client_class.return_value = mock_client
-
-                screen = WorkPackagesScreen(mock_project)
-                await app.push_screen(screen)
-                await pilot.pause()
-
-                # Check for empty message
-                empty_label = screen.query_one("#empty_message")
-                assert empty_label is not None
-                assert "No work packages" in str(empty_label.renderable)
-
-    @pytest.mark.asyncio
-    async def test_work_packages_error_handling(self, mock_project):
+        app = pilot.app
+
+        screen = WorkPackagesScreen(mock_project)
+        await app.push_screen(screen)
+        await screen._load_worker.wait()
+
+        # Check for empty message
+        empty_label = screen.query_one("#empty_message")
+        assert empty_label is not None
+        assert "No work packages" in plain_text(empty_label)
+
+    async def test_work_packages_error_handling(
+        self, pilot, mock_project, mock_clients, monkeypatch
+    ):
         """Test error handling when loading fails."""
-        async with OpenProjectApp().run_test() as pilot:
-            app = pilot.app
-
-            with patch(
-                "src.screens.work_packages.OpenProjectClient"
-            ) as mock_client_class:
-                mock_client = MagicMock()
-                mock_client.get_work_packages = AsyncMock(
-                    side_effect=Exception("API Error")
-                )
-                mock_client.close = AsyncMock()
-                mock_client_class.return_value = mock_client
-
-                screen = WorkPackagesScreen(mock_project)
-                await app.push_screen(screen)
-                await pilot.pause()
-
-                # Check for error message
-                error_label = screen.query_one("#error")
-                assert error_label is not None
-                assert "Error loading work packages" in str(error_label.renderable)
-
-    @pytest.mark.asyncio
-    async def test_back_navigation(self, mock_project):
-        """Test pressing Escape goes back to main screen."""
-        async with OpenProjectApp().run_test() as pilot:
-            app = pilot.app
+        app = pilot.app
 
-            with patch(
-                "src.screens.work_packages.OpenProjectClient"
-            ) as mock_client_class:
-                mock_client = MagicMock()
-                mock_client.get_work_packages = AsyncMock(return_value=[])
-                mock_client.close = AsyncMock()
-                mock_client_class.return_value = mock_client
+        monkeypatch.setattr(mock_clients, "get_work_packages_stream", _fail_stream)
+
+        screen = WorkPackagesScreen(mock_project)
+        await app.push_screen(screen)
+        await screen._load_worker.wait()
+
+        # Check for error message
+        error_label = screen.query_one("#error")
+        assert error_label is not None
+        assert "Error loading work packages" in plain_text(error_label)
+
+    async def test_work_packages_error_after_first_page(
+        self, pilot, mock_project, mock_clients, monkeypatch
+    ):
+        """Test a failure mid-stream hides the partial list behind the error."""
+        monkeypatch.setattr(
+            mock_clients, "get_work_packages_stream", _fail_after_first_page
+        )
+
+        screen = WorkPackagesScreen(mock_project)
+        await pilot.app.push_screen(screen)
+        await screen._load_worker.wait()
+
+        assert not screen.query_one("#work_packages_table").display
+        error_label = screen.query_one("#error")
+        assert error_label.display
+        assert "Error loading work packages" in plain_text(error_label)
+
+    async def test_back_navigation(self, pilot, mock_project):
+        """Test pressing Escape goes back to main screen."""
+        app = pilot.app
 
-                screen = WorkPackagesScreen(mock_project)
-                await app.push_screen(screen)
-                await pilot.pause()
+        screen = WorkPackagesScreen(mock_project)
+        await app.push_screen(screen)
+        await screen._load_worker.wait()
 
-                initial_stack_size = len(app.screen_stack)
+        initial_stack_size = len(app.screen_stack)
 
-                # Press Escape
-                await pilot.press("escape")
-                await pilot.pause()
+        # Press Escape
+        await pilot.press("escape")
 
-                # Should pop the screen
-                assert len(app.screen_stack) == initial_stack_size - 1
+        # Should pop the screen
+        assert len(app.screen_stack) == initial_stack_size - 1
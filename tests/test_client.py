@@ -1,163 +1,337 @@
-"""Tests for the OpenProject API client using pytest-httpx."""
+"""Tests for the OpenProject API client using a mock transport."""
 
-import json
+import asyncio
+
+import httpx
 import pytest
-from pytest_httpx import HTTPXMock
+import pytest_asyncio
 
 from src.client import OpenProjectClient, AuthenticationError, APIError
 from src.models import Project, WorkPackage
 from .test_fixtures import (
-    ROOT_RESPONSE,
-    PROJECTS_LIST_RESPONSE,
-    PROJECTS_EMPTY_RESPONSE,
-    WORK_PACKAGES_LIST_RESPONSE,
-    WORK_PACKAGES_EMPTY_RESPONSE,
+    ACTIVE_FILTER_QS,
+    BASIC_AUTH_HEADER,
+    root_response,
+    projects_list_response,
+    projects_empty_response,
+    work_packages_list_response,
+    work_packages_empty_response,
     ERROR_UNAUTHORIZED,
     ERROR_INTERNAL_SERVER,
 )
+from .conftest import assert_model, json_route
+
+BASE_URL = "https://openproject.example.com/api/v3"
+API_PATH = "/api/v3"
 
 
 class TestOpenProjectClient:
-    """Test cases for OpenProject API client using pytest-httpx."""
+    """Test cases for OpenProject API client using a mock transport."""
 
-    @pytest.fixture
-    def client(self):
-        """Create a test client."""
-        return OpenProjectClient(
-            api_url="https://openproject.example.com/api/v3", api_key="test_key"
-        )
+    @pytest_asyncio.fixture(scope="module")
+    async def http_client(self, mock_transport):
+        """Create one HTTP client shared by the module's API clients."""
+        async with httpx.AsyncClient(
+            base_url=BASE_URL,
+            transport=mock_transport,
+        ) as http_client:
+            yield http_client
+
+    @pytest.fixture(scope="module")
+    def client(self, http_client):
+        """Create one test client shared by the module's tests."""
+        return OpenProjectClient.from_async_client(http_client, BASE_URL, "test_key")
+
+    @pytest.fixture(autouse=True)
+    def reset_routes(self, routes):
+        """Drop the routes a test registered."""
+        yield
+        routes.clear()
 
     @pytest.fixture
-    def base_url(self):
-        """Base URL for the API."""
-        return "https://openproject.example.com/api/v3"
+    def mock_api(self, routes):
+        """Route the common read endpoints."""
+        routes[f"{API_PATH}/"] = json_route(root_response())
+        routes[f"{API_PATH}/projects"] = json_route(projects_list_response())
+        routes[f"{API_PATH}/work_packages"] = json_route(work_packages_list_response())
+        return routes
 
     def test_client_initialization(self):
         """Test client initializes with proper configuration."""
-        client = OpenProjectClient(
-            api_url="https://openproject.example.com/api/v3", api_key="test_key"
-        )
-        assert client.api_url == "https://openproject.example.com/api/v3"
+        client = OpenProjectClient(api_url=BASE_URL, api_key="test_key")
+        assert client.api_url == BASE_URL
         assert client.api_key == "test_key"
         # Verify Basic auth header is properly encoded
-        assert client.headers["Authorization"] == "Basic YXBpa2V5OnRlc3Rfa2V5"
+        assert client.headers["Authorization"] == BASIC_AUTH_HEADER
 
     def test_client_without_api_key_raises_error(self):
         """Test client raises error when API key is missing."""
         with pytest.raises(ValueError, match="API key is required"):
-            OpenProjectClient(
-                api_url="https://openproject.example.com/api/v3", api_key=""
-            )
+            OpenProjectClient(api_url=BASE_URL, api_key="")
 
-    @pytest.mark.asyncio
-    async def test_test_connection_success(
-        self, client, httpx_mock: HTTPXMock, base_url
-    ):
+    async def test_test_connection_success(self, client, mock_api):
         """Test successful connection test."""
-        httpx_mock.add_response(url=f"{base_url}/", json=ROOT_RESPONSE)
-
         result = await client.test_connection()
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_test_connection_authentication_failure(
-        self, client, httpx_mock: HTTPXMock, base_url
-    ):
+    async def test_test_connection_authentication_failure(self, client, routes):
         """Test connection with authentication failure."""
-        httpx_mock.add_response(
-            url=f"{base_url}/", status_code=401, json=ERROR_UNAUTHORIZED
-        )
+        routes[f"{API_PATH}/"] = json_route(ERROR_UNAUTHORIZED, status_code=401)
 
         with pytest.raises(AuthenticationError):
             await client.test_connection()
 
-    @pytest.mark.asyncio
-    async def test_get_projects(self, client, httpx_mock: HTTPXMock, base_url):
+    async def test_get_projects(self, client, mock_api):
         """Test fetching projects list."""
-        httpx_mock.add_response(
-            url=f"{base_url}/projects?offset=1&pageSize=25", json=PROJECTS_LIST_RESPONSE
-        )
-
         projects = await client.get_projects()
 
         assert len(projects) == 2
         assert all(isinstance(p, Project) for p in projects)
-        assert projects[0].identifier == "demo-project"
-        assert projects[0].name == "Demo Project"
-        assert projects[1].identifier == "test-project"
-        assert projects[1].name == "Test Project"
-
-    @pytest.mark.asyncio
-    async def test_get_projects_with_filters(
-        self, client, httpx_mock: HTTPXMock, base_url
-    ):
-        """Test fetching projects with filters."""
-        filters = json.dumps([{"active": {"operator": "=", "values": ["t"]}}])
-        httpx_mock.add_response(
-            url=f"{base_url}/projects?offset=11&pageSize=10&filters={filters}",
-            json=PROJECTS_EMPTY_RESPONSE,
+        assert_model(
+            projects[0], {"identifier": "demo-project", "name": "Demo Project"}
+        )
+        assert_model(
+            projects[1], {"identifier": "test-project", "name": "Test Project"}
         )
 
+    async def test_get_projects_with_filters(self, client, routes):
+        """Test fetching projects with filters."""
+        requests = []
+
+        def projects_route(request):
+            requests.append(request)
+            return httpx.Response(200, json=projects_empty_response())
+
+        routes[f"{API_PATH}/projects"] = projects_route
+
         projects = await client.get_projects(active=True, page=2, page_size=10)
         assert len(projects) == 0
-
-    @pytest.mark.asyncio
-    async def test_get_work_packages(self, client, httpx_mock: HTTPXMock, base_url):
-        """Test fetching work packages."""
-        httpx_mock.add_response(
-            url=f"{base_url}/work_packages?offset=1&pageSize=25",
-            json=WORK_PACKAGES_LIST_RESPONSE,
+        assert requests[0].url.params == httpx.QueryParams(
+            f"offset=2&pageSize=10&filters={ACTIVE_FILTER_QS}"
         )
 
+    async def test_get_work_packages(self, client, mock_api):
+        """Test fetching work packages."""
         work_packages = await client.get_work_packages()
 
         assert len(work_packages) == 1
         assert isinstance(work_packages[0], WorkPackage)
-        assert work_packages[0].subject == "Fix login bug"
-        assert work_packages[0].status.name == "New"
-        assert work_packages[0].type.name == "Bug"
-        assert work_packages[0].priority.name == "High"
-
-    @pytest.mark.asyncio
-    async def test_get_project_work_packages(
-        self, client, httpx_mock: HTTPXMock, base_url
-    ):
+        assert_model(
+            work_packages[0],
+            {
+                "subject": "Fix login bug",
+                "status.name": "New",
+                "type.name": "Bug",
+                "priority.name": "High",
+            },
+        )
+
+    async def test_get_project_work_packages(self, client, routes):
         """Test fetching work packages for a specific project."""
-        httpx_mock.add_response(
-            url=f"{base_url}/projects/1/work_packages?offset=1&pageSize=25",
-            json=WORK_PACKAGES_EMPTY_RESPONSE,
+        routes[f"{API_PATH}/projects/1/work_packages"] = json_route(
+            work_packages_empty_response()
         )
 
         work_packages = await client.get_work_packages(project_id=1)
         assert len(work_packages) == 0
 
-    @pytest.mark.asyncio
-    async def test_api_error(self, client, httpx_mock: HTTPXMock, base_url):
-        """Test API error handling."""
-        httpx_mock.add_response(
-            url=f"{base_url}/test", status_code=500, json=ERROR_INTERNAL_SERVER
-        )
+    async def test_get_work_packages_stream(self, client, routes):
+        """Test streaming work packages across multiple pages."""
+        element = work_packages_list_response()["_embedded"]["elements"][0]
+        offsets = []
+
+        def page_route(request):
+            assert request.url.params["pageSize"] == "2"
+            page = int(request.url.params["offset"])
+            offsets.append(page)
+            # Five work packages, two per page: ids 1-2, 3-4 and 5
+            ids = range(2 * page - 1, min(2 * page, 5) + 1)
+            return httpx.Response(
+                200,
+                json={
+                    "_embedded": {"elements": [{**element, "id": i} for i in ids]},
+                    "_type": "Collection",
+                    "total": 5,
+                    "count": len(ids),
+                },
+            )
+
+        routes[f"{API_PATH}/projects/1/work_packages"] = page_route
+
+        work_packages = [
+            wp
+            async for wp in client.get_work_packages_stream(project_id=1, page_size=2)
+        ]
+
+        # offset is the page number, so pages 2 and 3 are offsets 2 and 3
+        assert sorted(offsets) == [1, 2, 3]
+        assert [wp.id for wp in work_packages] == [1, 2, 3, 4, 5]
+        assert all(isinstance(wp, WorkPackage) for wp in work_packages)
+
+    async def test_get_work_packages_stream_skips_repeated_ids(self, client, routes):
+        """Test a work package shifted onto a later page is yielded once."""
+        element = work_packages_list_response()["_embedded"]["elements"][0]
+
+        def page_route(request):
+            # An item inserted between requests pushes id 2 onto page 2 as well
+            ids = {"1": [1, 2], "2": [2, 3]}[request.url.params["offset"]]
+            return httpx.Response(
+                200,
+                json={
+                    "_embedded": {"elements": [{**element, "id": i} for i in ids]},
+                    "_type": "Collection",
+                    "total": 4,
+                    "count": 2,
+                },
+            )
+
+        routes[f"{API_PATH}/projects/1/work_packages"] = page_route
+
+        work_packages = [
+            wp
+            async for wp in client.get_work_packages_stream(project_id=1, page_size=2)
+        ]
+
+        assert [wp.id for wp in work_packages] == [1, 2, 3]
+
+    async def test_get_work_packages_stream_failure_awaits_pages(self, client, routes):
+        """Test a failed stream finishes cancelling its page requests first."""
+        element = work_packages_list_response()["_embedded"]["elements"][0]
+        cancelled = []
+
+        async def page_route(request):
+            page = request.url.params["offset"]
+            if page == "2":
+                return httpx.Response(500, json=ERROR_INTERNAL_SERVER)
+            if page == "3":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(page)
+                    raise
+            return httpx.Response(
+                200,
+                json={
+                    "_embedded": {"elements": [{**element, "id": 1}]},
+                    "_type": "Collection",
+                    "total": 3,
+                    "count": 1,
+                },
+            )
+
+        routes[f"{API_PATH}/projects/1/work_packages"] = page_route
 
         with pytest.raises(APIError):
-            await client._get("/test")
+            async for _ in client.get_work_packages_stream(project_id=1, page_size=1):
+                pass
 
-    @pytest.mark.asyncio
-    async def test_multiple_requests(self, client, httpx_mock: HTTPXMock, base_url):
-        """Test multiple API calls in sequence."""
-        # Add multiple responses with exact URLs
-        httpx_mock.add_response(
-            url=f"{base_url}/projects?offset=1&pageSize=25", json=PROJECTS_LIST_RESPONSE
+        assert cancelled == ["3"]
+
+    async def test_get_retries_rate_limited_request(self, client, routes, monkeypatch):
+        """Test GET requests are retried after HTTP 429."""
+        monkeypatch.setattr(client, "RETRY_BACKOFF", 0)
+        responses = iter(
+            [httpx.Response(429), httpx.Response(200, json=root_response())]
         )
-        httpx_mock.add_response(
-            url=f"{base_url}/work_packages?offset=1&pageSize=25",
-            json=WORK_PACKAGES_LIST_RESPONSE,
+        routes[f"{API_PATH}/"] = lambda request: next(responses)
+
+        result = await client._get("/")
+        assert result == root_response()
+
+    async def test_get_request_with_params(self, client, routes):
+        """Test query parameters are sent with GET requests."""
+        requests = []
+
+        def statuses_route(request):
+            requests.append(request)
+            return httpx.Response(200, json={"_embedded": {}})
+
+        routes[f"{API_PATH}/statuses"] = statuses_route
+
+        result = await client._get("/statuses", params={"offset": 1, "pageSize": 5})
+        assert result == {"_embedded": {}}
+        assert requests[0].url.params == httpx.QueryParams("offset=1&pageSize=5")
+
+    async def test_shared_client_sends_auth_headers(self, client, routes):
+        """Test requests through a shared HTTP client carry this client's headers."""
+        requests = []
+
+        def root_route(request):
+            requests.append(request)
+            return httpx.Response(200, json=root_response())
+
+        routes[f"{API_PATH}/"] = root_route
+
+        await client.test_connection()
+        assert requests[0].headers["Authorization"] == BASIC_AUTH_HEADER
+        assert requests[0].headers["Accept"] == "application/hal+json"
+
+    async def test_close_client(self):
+        """Test closing the client closes the underlying HTTP client."""
+        client = OpenProjectClient(api_url=BASE_URL, api_key="test_key")
+
+        await client.close()
+        assert client._client.is_closed
+
+    async def test_context_manager(self):
+        """Test the client closes itself when used as a context manager."""
+        async with OpenProjectClient(api_url=BASE_URL, api_key="test_key") as client:
+            assert not client._client.is_closed
+
+        assert client._client.is_closed
+
+    async def test_close_keeps_shared_client_open(self, http_client):
+        """Test closing leaves a client from an injected factory open."""
+        client = OpenProjectClient(
+            api_url=BASE_URL,
+            api_key="test_key",
+            client_factory=lambda **kwargs: http_client,
         )
 
-        # Make multiple calls
-        projects = await client.get_projects()
-        work_packages = await client.get_work_packages()
+        await client.close()
+        assert client._client is http_client
+        assert not http_client.is_closed
+
+    @pytest.mark.parametrize(
+        "headers, attempt, expected",
+        [
+            ({"Retry-After": "3"}, 0, 3.0),
+            ({"Retry-After": "3600"}, 0, 10.0),
+            ({}, 0, 0.5),
+            ({}, 2, 2.0),
+        ],
+    )
+    def test_retry_delay(self, client, headers, attempt, expected):
+        """Test retry delays honour Retry-After, back off otherwise, and are capped."""
+        response = httpx.Response(429, headers=headers)
+        assert client._retry_delay(response, attempt) == expected
+
+    async def test_api_error(self, client, routes):
+        """Test API error handling."""
+        routes[f"{API_PATH}/test"] = json_route(ERROR_INTERNAL_SERVER, status_code=500)
+
+        with pytest.raises(APIError):
+            await client._get("/test")
+
+    async def test_multiple_requests(self, client, routes):
+        """Test independent API calls made concurrently."""
+        calls = []
+
+        def route(data):
+            def handler(request):
+                calls.append(request.url.path)
+                return httpx.Response(200, json=data)
+
+            return handler
+
+        routes[f"{API_PATH}/projects"] = route(projects_list_response())
+        routes[f"{API_PATH}/work_packages"] = route(work_packages_list_response())
+
+        projects, work_packages = await asyncio.gather(
+            client.get_projects(), client.get_work_packages()
+        )
 
         assert len(projects) == 2
         assert len(work_packages) == 1
-
-        # httpx_mock automatically verifies all mocked calls were made
+        # Each endpoint was requested exactly once
+        assert sorted(calls) == [f"{API_PATH}/projects", f"{API_PATH}/work_packages"]
@@ -1,81 +1,143 @@
 """Test fixtures and mock data for OpenProject API responses."""
 
+import json
+from urllib.parse import quote
+
+import orjson
+
+
+# Query string value for the ?filters= param of an active-projects request
+ACTIVE_FILTER_QS = quote(json.dumps([{"active": {"operator": "=", "values": ["t"]}}]))
+
+# Authorization header for the "test_key" API key
+BASIC_AUTH_HEADER = "Basic YXBpa2V5OnRlc3Rfa2V5"
+
+
+# Responses are stored as JSON and parsed on each call, so every caller
+# gets its own copy to mutate
+
 # Root API response
-ROOT_RESPONSE = {
+_ROOT_JSON = b"""{
     "_type": "Root",
     "_links": {
-        "self": {"href": "/api/v3"},
-        "projects": {"href": "/api/v3/projects"},
-        "workPackages": {"href": "/api/v3/work_packages"},
-        "users": {"href": "/api/v3/users"},
-        "types": {"href": "/api/v3/types"},
-        "statuses": {"href": "/api/v3/statuses"},
-        "priorities": {"href": "/api/v3/priorities"},
-    },
-}
+        "self": {
+            "href": "/api/v3"
+        },
+        "projects": {
+            "href": "/api/v3/projects"
+        },
+        "workPackages": {
+            "href": "/api/v3/work_packages"
+        },
+        "users": {
+            "href": "/api/v3/users"
+        },
+        "types": {
+            "href": "/api/v3/types"
+        },
+        "statuses": {
+            "href": "/api/v3/statuses"
+        },
+        "priorities": {
+            "href": "/api/v3/priorities"
+        }
+    }
+}"""
+
+
+def root_response() -> dict:
+    """Root API response."""
+    return orjson.loads(_ROOT_JSON)
+
 
 # Projects responses
-PROJECTS_LIST_RESPONSE = {
+_PROJECTS_LIST_JSON = b"""{
     "_embedded": {
         "elements": [
             {
                 "id": 1,
                 "identifier": "demo-project",
                 "name": "Demo Project",
-                "active": True,
-                "public": False,
+                "active": true,
+                "public": false,
                 "description": {
                     "format": "markdown",
                     "raw": "A demo project for testing",
-                    "html": "<p>A demo project for testing</p>",
+                    "html": "<p>A demo project for testing</p>"
                 },
                 "createdAt": "2024-01-01T00:00:00Z",
                 "updatedAt": "2024-01-02T00:00:00Z",
                 "_type": "Project",
                 "_links": {
-                    "self": {"href": "/api/v3/projects/1"},
-                    "workPackages": {"href": "/api/v3/projects/1/work_packages"},
-                    "categories": {"href": "/api/v3/projects/1/categories"},
-                    "versions": {"href": "/api/v3/projects/1/versions"},
-                },
+                    "self": {
+                        "href": "/api/v3/projects/1"
+                    },
+                    "workPackages": {
+                        "href": "/api/v3/projects/1/work_packages"
+                    },
+                    "categories": {
+                        "href": "/api/v3/projects/1/categories"
+                    },
+                    "versions": {
+                        "href": "/api/v3/projects/1/versions"
+                    }
+                }
             },
             {
                 "id": 2,
                 "identifier": "test-project",
                 "name": "Test Project",
-                "active": True,
-                "public": True,
+                "active": true,
+                "public": true,
                 "description": {
                     "format": "markdown",
                     "raw": "A test project",
-                    "html": "<p>A test project</p>",
+                    "html": "<p>A test project</p>"
                 },
                 "createdAt": "2024-01-01T00:00:00Z",
                 "updatedAt": "2024-01-02T00:00:00Z",
                 "_type": "Project",
                 "_links": {
-                    "self": {"href": "/api/v3/projects/2"},
-                    "workPackages": {"href": "/api/v3/projects/2/work_packages"},
-                },
-            },
+                    "self": {
+                        "href": "/api/v3/projects/2"
+                    },
+                    "workPackages": {
+                        "href": "/api/v3/projects/2/work_packages"
+                    }
+                }
+            }
         ]
     },
     "_type": "Collection",
     "total": 2,
     "count": 2,
     "pageSize": 25,
-    "offset": 1,
-}
+    "offset": 1
+}"""
+
+
+def projects_list_response() -> dict:
+    """Projects list response."""
+    return orjson.loads(_PROJECTS_LIST_JSON)
+
 
-PROJECTS_EMPTY_RESPONSE = {
-    "_embedded": {"elements": []},
+_PROJECTS_EMPTY_JSON = b"""{
+    "_embedded": {
+        "elements": []
+    },
     "_type": "Collection",
     "total": 0,
-    "count": 0,
-}
+    "count": 0
+}"""
+
+
+def projects_empty_response() -> dict:
+    """Projects empty response."""
+    return orjson.loads(_PROJECTS_EMPTY_JSON)
+
 
 # Work packages responses
-WORK_PACKAGES_LIST_RESPONSE = {
+_WORK_PACKAGES_LIST_JSON = b"""{
     "_embedded": {
         "elements": [
             {
@@ -84,7 +146,7 @@ WORK_PACKAGES_LIST_RESPONSE = {
                 "description": {
                     "format": "markdown",
                     "raw": "Login fails with special characters",
-                    "html": "<p>Login fails with special characters</p>",
+                    "html": "<p>Login fails with special characters</p>"
                 },
                 "startDate": "2024-01-01",
                 "dueDate": "2024-01-15",
@@ -98,40 +160,52 @@ WORK_PACKAGES_LIST_RESPONSE = {
                         "id": 1,
                         "name": "New",
                         "color": "#0066CC",
-                        "_type": "Status",
+                        "_type": "Status"
                     },
                     "type": {
                         "id": 2,
                         "name": "Bug",
                         "color": "#CC0000",
-                        "_type": "Type",
+                        "_type": "Type"
+                    },
+                    "priority": {
+                        "id": 8,
+                        "name": "High",
+                        "_type": "Priority"
                     },
-                    "priority": {"id": 8, "name": "High", "_type": "Priority"},
                     "project": {
                         "id": 1,
                         "identifier": "demo-project",
                         "name": "Demo Project",
-                        "_type": "Project",
+                        "_type": "Project"
                     },
                     "author": {
                         "id": 1,
                         "name": "John Doe",
                         "email": "john@example.com",
-                        "_type": "User",
+                        "_type": "User"
                     },
                     "assignee": {
                         "id": 2,
                         "name": "Jane Smith",
                         "email": "jane@example.com",
-                        "_type": "User",
-                    },
+                        "_type": "User"
+                    }
                 },
                 "_links": {
-                    "self": {"href": "/api/v3/work_packages/1"},
-                    "project": {"href": "/api/v3/projects/1"},
-                    "activities": {"href": "/api/v3/work_packages/1/activities"},
-                    "attachments": {"href": "/api/v3/work_packages/1/attachments"},
-                },
+                    "self": {
+                        "href": "/api/v3/work_packages/1"
+                    },
+                    "project": {
+                        "href": "/api/v3/projects/1"
+                    },
+                    "activities": {
+                        "href": "/api/v3/work_packages/1/activities"
+                    },
+                    "attachments": {
+                        "href": "/api/v3/work_packages/1/attachments"
+                    }
+                }
             }
         ]
     },
@@ -139,15 +213,29 @@ WORK_PACKAGES_LIST_RESPONSE = {
     "total": 1,
     "count": 1,
     "pageSize": 25,
-    "offset": 1,
-}
+    "offset": 1
+}"""
+
 
-WORK_PACKAGES_EMPTY_RESPONSE = {
-    "_embedded": {"elements": []},
+def work_packages_list_response() -> dict:
+    """Work packages list response."""
+    return orjson.loads(_WORK_PACKAGES_LIST_JSON)
+
+
+_WORK_PACKAGES_EMPTY_JSON = b"""{
+    "_embedded": {
+        "elements": []
+    },
     "_type": "Collection",
     "total": 0,
-    "count": 0,
-}
+    "count": 0
+}"""
+
+
+def work_packages_empty_response() -> dict:
+    """Work packages empty response."""
+    return orjson.loads(_WORK_PACKAGES_EMPTY_JSON)
+
 
 # Error responses
 ERROR_UNAUTHORIZED = {
@@ -172,7 +260,7 @@ ERROR_INTERNAL_SERVER = {
 # Test data helpers
 def get_project_by_id(project_id: int):
     """Get a specific project from the test data."""
-    for project in PROJECTS_LIST_RESPONSE["_embedded"]["elements"]:
+    for project in projects_list_response()["_embedded"]["elements"]:
         if project["id"] == project_id:
             return project
     return None
@@ -180,7 +268,7 @@ def get_project_by_id(project_id: int):
 
 def get_work_package_by_id(wp_id: int):
     """Get a specific work package from the test data."""
-    for wp in WORK_PACKAGES_LIST_RESPONSE["_embedded"]["elements"]:
+    for wp in work_packages_list_response()["_embedded"]["elements"]:
         if wp["id"] == wp_id:
             return wp
     return None
@@ -2,7 +2,19 @@
 
 from datetime import datetime
 
-from src.models import Project, WorkPackage, User
+import pytest
+
+from src.models import (
+    Priority,
+    Project,
+    Status,
+    Type,
+    User,
+    WorkPackage,
+    _parse_dt,
+)
+
+from .conftest import assert_model
 
 
 class TestUserModel:
@@ -22,12 +34,15 @@ class TestUserModel:
             },
         }
 
-        user = User.from_hal_json(hal_data)
-
-        assert user.id == 1
-        assert user.name == "John Doe"
-        assert user.email == "john@example.com"
-        assert user.avatar_url == "https://example.com/avatar.jpg"
+        assert_model(
+            User.from_hal_json(hal_data),
+            {
+                "id": 1,
+                "name": "John Doe",
+                "email": "john@example.com",
+                "avatar_url": "https://example.com/avatar.jpg",
+            },
+        )
 
     def test_user_display_name(self):
         """Test user display name formatting."""
@@ -38,150 +53,178 @@ class TestUserModel:
         assert str(user_no_name) == "jane@example.com"
 
 
-class TestProjectModel:
-    """Test cases for Project model."""
+PROJECT_HAL = {
+    "id": 1,
+    "identifier": "demo-project",
+    "name": "Demo Project",
+    "active": True,
+    "public": False,
+    "description": {
+        "format": "markdown",
+        "raw": "A demo project",
+        "html": "<p>A demo project</p>",
+    },
+    "createdAt": "2024-01-01T00:00:00Z",
+    "updatedAt": "2024-01-02T00:00:00Z",
+    "_type": "Project",
+    "_links": {
+        "self": {"href": "/api/v3/projects/1"},
+        "workPackages": {"href": "/api/v3/projects/1/work_packages"},
+    },
+}
 
-    def test_project_from_hal_json(self):
-        """Test creating Project from HAL+JSON response."""
-        hal_data = {
+PROJECT_MINIMAL_HAL = {
+    "id": 2,
+    "identifier": "minimal",
+    "name": "Minimal Project",
+    "_type": "Project",
+    "_links": {"self": {"href": "/api/v3/projects/2"}},
+}
+
+WORK_PACKAGE_HAL = {
+    "id": 1,
+    "subject": "Fix login bug",
+    "description": {
+        "format": "markdown",
+        "raw": "Login fails with special characters",
+        "html": "<p>Login fails with special characters</p>",
+    },
+    "startDate": "2024-01-01",
+    "dueDate": "2024-01-15",
+    "estimatedTime": "PT8H",
+    "percentageDone": 50,
+    "createdAt": "2024-01-01T00:00:00Z",
+    "updatedAt": "2024-01-02T00:00:00Z",
+    "_type": "WorkPackage",
+    "_embedded": {
+        "status": {
+            "id": 1,
+            "name": "In Progress",
+            "color": "#0066CC",
+            "_type": "Status",
+        },
+        "type": {"id": 2, "name": "Bug", "color": "#CC0000", "_type": "Type"},
+        "priority": {"id": 8, "name": "High", "_type": "Priority"},
+        "project": {
             "id": 1,
             "identifier": "demo-project",
             "name": "Demo Project",
-            "active": True,
-            "public": False,
-            "description": {
-                "format": "markdown",
-                "raw": "A demo project",
-                "html": "<p>A demo project</p>",
-            },
-            "createdAt": "2024-01-01T00:00:00Z",
-            "updatedAt": "2024-01-02T00:00:00Z",
             "_type": "Project",
-            "_links": {
-                "self": {"href": "/api/v3/projects/1"},
-                "workPackages": {"href": "/api/v3/projects/1/work_packages"},
-            },
-        }
+        },
+        "author": {"id": 1, "name": "John Doe", "_type": "User"},
+        "assignee": {"id": 2, "name": "Jane Smith", "_type": "User"},
+    },
+    "_links": {"self": {"href": "/api/v3/work_packages/1"}},
+}
 
-        project = Project.from_hal_json(hal_data)
+WORK_PACKAGE_MINIMAL_HAL = {
+    "id": 2,
+    "subject": "Minimal work package",
+    "_type": "WorkPackage",
+    "_embedded": {
+        "status": {"id": 1, "name": "New", "_type": "Status"},
+        "project": {"id": 1, "name": "Project", "_type": "Project"},
+    },
+    "_links": {"self": {"href": "/api/v3/work_packages/2"}},
+}
 
-        assert project.id == 1
-        assert project.identifier == "demo-project"
-        assert project.name == "Demo Project"
-        assert project.active is True
-        assert project.public is False
-        assert project.description == "A demo project"
-        assert project.created_at == datetime.fromisoformat(
-            "2024-01-01T00:00:00Z".replace("Z", "+00:00")
-        )
-        assert project.updated_at == datetime.fromisoformat(
-            "2024-01-02T00:00:00Z".replace("Z", "+00:00")
-        )
+JAN_1 = datetime.fromisoformat("2024-01-01T00:00:00+00:00")
+JAN_2 = datetime.fromisoformat("2024-01-02T00:00:00+00:00")
 
-    def test_project_from_hal_json_minimal(self):
-        """Test creating Project from minimal HAL+JSON response."""
-        hal_data = {
-            "id": 2,
-            "identifier": "minimal",
-            "name": "Minimal Project",
-            "_type": "Project",
-            "_links": {"self": {"href": "/api/v3/projects/2"}},
-        }
 
-        project = Project.from_hal_json(hal_data)
+class TestProjectModel:
+    """Test cases for Project model."""
+
+    @pytest.mark.parametrize(
+        "hal_data, expected",
+        [
+            (
+                PROJECT_HAL,
+                {
+                    "id": 1,
+                    "identifier": "demo-project",
+                    "name": "Demo Project",
+                    "active": True,
+                    "public": False,
+                    "description": "A demo project",
+                    "created_at": JAN_1,
+                    "updated_at": JAN_2,
+                },
+            ),
+            (
+                PROJECT_MINIMAL_HAL,
+                {
+                    "id": 2,
+                    "identifier": "minimal",
+                    "name": "Minimal Project",
+                    "active": True,  # default
+                    "public": False,  # default
+                    "description": "",
+                    "created_at": None,
+                    "updated_at": None,
+                },
+            ),
+        ],
+        ids=["full", "minimal"],
+    )
+    def test_project_from_hal_json(self, hal_data, expected):
+        """Test creating Project from HAL+JSON response."""
+        assert_model(Project.from_hal_json(hal_data), expected)
 
-        assert project.id == 2
-        assert project.identifier == "minimal"
-        assert project.name == "Minimal Project"
-        assert project.active is True  # default
-        assert project.public is False  # default
-        assert project.description == ""
-        assert project.created_at is None
-        assert project.updated_at is None
+    def test_project_timestamps_are_cached(self):
+        """Test repeated timestamp strings share one parsed datetime."""
+        project = Project.from_hal_json(PROJECT_HAL)
+        assert project.created_at is _parse_dt("2024-01-01T00:00:00Z")
+        assert project.created_at is Project.from_hal_json(PROJECT_HAL).created_at
 
 
 class TestWorkPackageModel:
     """Test cases for WorkPackage model."""
 
-    def test_work_package_from_hal_json(self):
-        """Test creating WorkPackage from HAL+JSON response."""
-        hal_data = {
-            "id": 1,
-            "subject": "Fix login bug",
-            "description": {
-                "format": "markdown",
-                "raw": "Login fails with special characters",
-                "html": "<p>Login fails with special characters</p>",
-            },
-            "startDate": "2024-01-01",
-            "dueDate": "2024-01-15",
-            "estimatedTime": "PT8H",
-            "percentageDone": 50,
-            "createdAt": "2024-01-01T00:00:00Z",
-            "updatedAt": "2024-01-02T00:00:00Z",
-            "_type": "WorkPackage",
-            "_embedded": {
-                "status": {
+    @pytest.mark.parametrize(
+        "hal_data, expected",
+        [
+            (
+                WORK_PACKAGE_HAL,
+                {
                     "id": 1,
-                    "name": "In Progress",
-                    "color": "#0066CC",
-                    "_type": "Status",
+                    "subject": "Fix login bug",
+                    "description": "Login fails with special characters",
+                    "start_date": "2024-01-01",
+                    "due_date": "2024-01-15",
+                    "estimated_hours": 8.0,
+                    "percentage_done": 50,
+                    "status": Status(id=1, name="In Progress", color="#0066CC"),
+                    "type": Type(id=2, name="Bug", color="#CC0000"),
+                    "priority": Priority(id=8, name="High"),
+                    "project": Project(
+                        id=1, identifier="demo-project", name="Demo Project"
+                    ),
+                    "author": User(id=1, name="John Doe"),
+                    "assignee": User(id=2, name="Jane Smith"),
+                    "created_at": JAN_1,
+                    "updated_at": JAN_2,
                 },
-                "type": {"id": 2, "name": "Bug", "color": "#CC0000", "_type": "Type"},
-                "priority": {"id": 8, "name": "High", "_type": "Priority"},
-                "project": {
-                    "id": 1,
-                    "identifier": "demo-project",
-                    "name": "Demo Project",
-                    "_type": "Project",
+            ),
+            (
+                WORK_PACKAGE_MINIMAL_HAL,
+                {
+                    "id": 2,
+                    "subject": "Minimal work package",
+                    "description": "",
+                    "percentage_done": 0,
+                    "status": Status(id=1, name="New"),
+                    "project": Project(id=1, identifier="", name="Project"),
+                    "author": None,
+                    "assignee": None,
                 },
-                "author": {"id": 1, "name": "John Doe", "_type": "User"},
-                "assignee": {"id": 2, "name": "Jane Smith", "_type": "User"},
-            },
-            "_links": {"self": {"href": "/api/v3/work_packages/1"}},
-        }
-
-        work_package = WorkPackage.from_hal_json(hal_data)
-
-        assert work_package.id == 1
-        assert work_package.subject == "Fix login bug"
-        assert work_package.description == "Login fails with special characters"
-        assert work_package.start_date == "2024-01-01"
-        assert work_package.due_date == "2024-01-15"
-        assert work_package.estimated_hours == 8.0
-        assert work_package.percentage_done == 50
-
-        assert work_package.status.name == "In Progress"
-        assert work_package.status.color == "#0066CC"
-        assert work_package.type.name == "Bug"
-        assert work_package.priority.name == "High"
-        assert work_package.project.name == "Demo Project"
-        assert work_package.author.name == "John Doe"
-        assert work_package.assignee.name == "Jane Smith"
-
-    def test_work_package_from_hal_json_minimal(self):
-        """Test creating WorkPackage from minimal HAL+JSON response."""
-        hal_data = {
-            "id": 2,
-            "subject": "Minimal work package",
-            "_type": "WorkPackage",
-            "_embedded": {
-                "status": {"id": 1, "name": "New", "_type": "Status"},
-                "project": {"id": 1, "name": "Project", "_type": "Project"},
-            },
-            "_links": {"self": {"href": "/api/v3/work_packages/2"}},
-        }
-
-        work_package = WorkPackage.from_hal_json(hal_data)
-
-        assert work_package.id == 2
-        assert work_package.subject == "Minimal work package"
-        assert work_package.description == ""
-        assert work_package.percentage_done == 0
-        assert work_package.status.name == "New"
-        assert work_package.project.name == "Project"
-        assert work_package.author is None
-        assert work_package.assignee is None
+            ),
+        ],
+        ids=["full", "minimal"],
+    )
+    def test_work_package_from_hal_json(self, hal_data, expected):
+        """Test creating WorkPackage from HAL+JSON response."""
+        assert_model(WorkPackage.from_hal_json(hal_data), expected)
 
     def test_work_package_estimated_time_parsing(self):
         """Test parsing of ISO 8601 duration for estimated time."""
@@ -191,6 +234,11 @@ class TestWorkPackageModel:
             ("PT30M", 0.5),  # 30 minutes
             ("PT1H45M", 1.75),  # 1 hour 45 minutes
             ("PT2H15M", 2.25),  # 2 hours 15 minutes
+            ("PT1.5H", 1.5),  # Fractional hours
+            ("PT1H0M0S", 1.0),  # Zero minutes and seconds
+            ("PT30M0S", 0.5),  # 30 minutes, zero seconds
+            ("PT1H30M36S", 1.51),  # 1 hour 30 minutes 36 seconds
+            ("PT90S", 0.025),  # Seconds only
             (None, None),  # No estimate
         ]
 
@@ -206,4 +254,4 @@ class TestWorkPackageModel:
                 },
             }
             work_package = WorkPackage.from_hal_json(hal_data)
-            assert work_package.estimated_hours == expected_hours
+            assert work_package.estimated_hours == pytest.approx(expected_hours)
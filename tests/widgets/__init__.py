@@ -0,0 +1 @@
+"""Widget tests package."""
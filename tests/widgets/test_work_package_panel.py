@@ -0,0 +1,114 @@
+"""Tests for work package panel widget."""
+
+from dataclasses import replace
+from datetime import datetime, timezone
+
+import pytest
+from unittest.mock import patch
+from textual.app import App, ComposeResult
+
+from src.models import Status, User, WorkPackage
+from src.widgets import WorkPackagePanel
+
+
+class PanelApp(App):
+    """Minimal app hosting a work package panel."""
+
+    def compose(self) -> ComposeResult:
+        """Compose the app layout."""
+        yield WorkPackagePanel(id="details_panel")
+
+
+class TestWorkPackagePanel:
+    """Test cases for WorkPackagePanel."""
+
+    @pytest.fixture(scope="module")
+    def mock_work_package(self):
+        """Create a mock work package."""
+        return WorkPackage(
+            id=1,
+            subject="Fix login bug",
+            description="Login fails with special characters",
+            status=Status(id=1, name="New", color="#0066CC"),
+            updated_at=datetime(2024, 1, 2, tzinfo=timezone.utc),
+        )
+
+    async def test_panel_reuses_cached_render(self, mock_work_package):
+        """Test revisiting a work package reuses the rendered text."""
+        async with PanelApp().run_test() as pilot:
+            panel = pilot.app.query_one(WorkPackagePanel)
+
+            panel.work_package = mock_work_package
+            header = panel._header_cache[(1, mock_work_package.updated_at)]
+            details = panel._details_cache[(1, mock_work_package.updated_at)]
+
+            panel.work_package = None
+            panel.work_package = mock_work_package
+
+            assert panel._header_cache[(1, mock_work_package.updated_at)] is header
+            assert panel._details_cache[(1, mock_work_package.updated_at)] is details
+            assert "Fix login bug" in header.plain
+
+    async def test_panel_rebuilds_after_update(self, mock_work_package):
+        """Test a newer updated_at produces a fresh render."""
+        async with PanelApp().run_test() as pilot:
+            panel = pilot.app.query_one(WorkPackagePanel)
+
+            panel.work_package = mock_work_package
+
+            updated = WorkPackage(
+                id=1,
+                subject="Fix login bug properly",
+                status=Status(id=1, name="New", color="#0066CC"),
+                updated_at=datetime(2024, 1, 3, tzinfo=timezone.utc),
+            )
+            panel.work_package = updated
+
+            header = panel._header_cache[(1, updated.updated_at)]
+            assert "Fix login bug properly" in header.plain
+
+    async def test_panel_prerender_fills_cache(self, mock_work_package):
+        """Test pre-rendering caches a work package without displaying it."""
+        async with PanelApp().run_test() as pilot:
+            panel = pilot.app.query_one(WorkPackagePanel)
+
+            panel.prerender(mock_work_package)
+
+            key = (1, mock_work_package.updated_at)
+            assert key in panel._header_cache
+            assert key in panel._details_cache
+            assert panel.work_package is None
+
+    async def test_panel_skips_unchanged_description(self, mock_work_package):
+        """Test the description markdown is only updated when it changes."""
+        async with PanelApp().run_test() as pilot:
+            panel = pilot.app.query_one(WorkPackagePanel)
+
+            panel.work_package = mock_work_package
+            assert "Login fails" in panel._last_description_md
+
+            with patch.object(panel._description, "update") as mock_update:
+                panel.show_details(mock_work_package)
+                mock_update.assert_not_called()
+
+            panel.work_package = None
+            assert panel._last_description_md == ""
+
+    @pytest.mark.parametrize(
+        "null_field, detail_text, has_description",
+        [("assignee", "Unassigned", True), ("description", "Jane Smith", False)],
+    )
+    async def test_panel_missing_fields(
+        self, mock_work_package, null_field, detail_text, has_description
+    ):
+        """Test the panel renders work packages with optional fields unset."""
+        fields = {"assignee": User(id=2, name="Jane Smith"), null_field: None}
+        work_package = replace(mock_work_package, **fields)
+        async with PanelApp().run_test() as pilot:
+            panel = pilot.app.query_one(WorkPackagePanel)
+
+            panel.work_package = work_package
+
+            details = panel._details_cache[(1, work_package.updated_at)]
+            assert detail_text in details.plain
+            assert bool(panel._last_description_md) is has_description